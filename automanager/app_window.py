@@ -1,9 +1,8 @@
-import sys
 import logging
 import json # For parsing FOUND_FILES_JSON
 from PyQt6.QtWidgets import QMainWindow, QDockWidget, QApplication, QMessageBox, QStatusBar
-from PyQt6.QtCore import Qt, QSize, QStandardPaths, QThread, QProcess, QTimer # Added QTimer
-from PyQt6.QtGui import QCloseEvent, QIcon
+from PyQt6.QtCore import Qt, QThread, QProcess, QTimer # Added QTimer
+from PyQt6.QtGui import QCloseEvent
 
 from .ui.navigation_pane import NavigationPane
 from .ui.file_browser_pane import FileBrowserPane
@@ -96,11 +95,8 @@ class MainWindow(QMainWindow):
             self.llm_terminal_pane.external_path_change_request
         )
 
-        terminal_widget = self.llm_terminal_pane.get_terminal_widget()
-        if terminal_widget:
-            terminal_widget.internal_directory_changed.connect( # Connect terminal 'cd' to FB
-                self.file_browser_pane.set_current_path
-            )
+        # The terminal is built when its tab is first shown or a command is sent to it
+        self.llm_terminal_pane.terminal_widget_created.connect(self._connect_terminal_widget)
 
         self.file_browser_pane.selection_changed_signal.connect(self.preview_metadata_pane.update_preview)
         self.file_browser_pane.status_message_signal.connect(self.status_bar.showMessage)
@@ -108,13 +104,17 @@ class MainWindow(QMainWindow):
         llm_chat_widget = self.llm_terminal_pane.get_llm_chat_widget()
         if llm_chat_widget:
             llm_chat_widget.command_submitted.connect(self._initiate_llm_command)
-            llm_chat_widget.execute_commands_requested.connect(
-                terminal_widget.run_command_externally if terminal_widget else lambda: None
-            )
+            llm_chat_widget.execute_commands_requested.connect(self.llm_terminal_pane.run_commands_in_terminal)
 
         self.file_browser_pane.request_llm_command_signal.connect(self._handle_file_browser_llm_request)
         logger.debug("Signals connected.")
 
+    def _connect_terminal_widget(self, terminal_widget):
+        terminal_widget.internal_directory_changed.connect( # Connect terminal 'cd' to FB
+            self.file_browser_pane.set_current_path
+        )
+        logger.debug("Terminal widget signals connected.")
+
     def _initiate_llm_command(self, command_text: str):
         self._handle_llm_command_async(command_text)
 
@@ -261,10 +261,11 @@ class MainWindow(QMainWindow):
             logger.debug("LLM thread forced stop during closeEvent.")
 
         if self.metadata_service:
+            self.preview_metadata_pane.flush_pending_metadata()
             logger.debug("Closing metadata service...")
             self.metadata_service.close()
 
-        terminal_widget = self.llm_terminal_pane.get_terminal_widget()
+        terminal_widget = self.llm_terminal_pane.get_terminal_widget(create=False)
         if terminal_widget and terminal_widget.process and terminal_widget.process.state() != QProcess.ProcessState.NotRunning:
             logger.warning("Terminal process is running during close.")
             reply = QMessageBox.question(self, "Confirm Exit",
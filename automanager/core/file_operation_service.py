@@ -1,16 +1,129 @@
 import os
+import stat
+import errno
 import shutil
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 from .security_service import security_manager # Use the global instance or pass one
 
 logger = logging.getLogger("automgr.core.file_op_service")
 
+# Tree copies/deletes are dominated by per-file syscalls that release the GIL, so a few threads overlap them well
+_TREE_OP_WORKERS = 8
+
+# copy_file_range keeps the bytes in the kernel and lets CoW filesystems (btrfs, XFS) share extents
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+_COPY_RANGE_UNSUPPORTED = frozenset({errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM})
+
+def _fast_copy2(src: str, dst: str) -> str:
+    """shutil.copy2 for one regular file, trying os.copy_file_range first."""
+    # FIFOs, devices etc. go to copy2, which refuses them instead of blocking in open()
+    if _HAS_COPY_FILE_RANGE and stat.S_ISREG(os.stat(src).st_mode):
+        if os.path.lexists(dst) and os.path.samefile(src, dst): # open(dst, 'wb') would truncate the source
+            raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+                while os.copy_file_range(src_fd, dst_fd, 1 << 30):
+                    pass
+            shutil.copystat(src, dst)
+            return dst
+        except OSError as e:
+            if e.errno not in _COPY_RANGE_UNSUPPORTED:
+                raise
+            logger.debug(f"copy_file_range unavailable for '{src}' ({e}), using shutil.copy2")
+    return shutil.copy2(src, dst)
+
+def _parallel_copytree(src: str, dst: str, workers: int = _TREE_OP_WORKERS):
+    """Like shutil.copytree(src, dst) (symlinks followed), with file copies spread over a thread pool."""
+    errors = []
+    copied_dirs = [] # (src, dst), parents before children
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = []
+        stack = [(src, dst)]
+        while stack:
+            src_dir, dst_dir = stack.pop()
+            try:
+                os.makedirs(dst_dir) # Directories are created here, before any copy into them is queued
+                copied_dirs.append((src_dir, dst_dir))
+                with os.scandir(src_dir) as it:
+                    for entry in it:
+                        target = os.path.join(dst_dir, entry.name)
+                        if entry.is_dir():
+                            stack.append((entry.path, target))
+                        else:
+                            futures.append((entry.path, target, pool.submit(_fast_copy2, entry.path, target)))
+            except OSError as e:
+                errors.append((src_dir, dst_dir, str(e)))
+        for src_path, dst_path, future in futures:
+            try:
+                future.result()
+            except OSError as e:
+                errors.append((src_path, dst_path, str(e)))
+    # Directory times last, since copying files into a directory updates its mtime
+    for src_dir, dst_dir in reversed(copied_dirs):
+        try:
+            shutil.copystat(src_dir, dst_dir)
+        except OSError as e:
+            errors.append((src_dir, dst_dir, str(e)))
+    if errors:
+        raise shutil.Error(errors)
+
+def _parallel_rmtree(path: str, workers: int = _TREE_OP_WORKERS):
+    """Like shutil.rmtree(path): files are unlinked on a thread pool, then directories removed deepest first."""
+    dirs = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = []
+        stack = [path]
+        while stack:
+            current = stack.pop()
+            dirs.append(current)
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False): # Never descend through a link
+                        stack.append(entry.path)
+                    else:
+                        futures.append(pool.submit(os.remove, entry.path))
+        for future in futures:
+            future.result() # Re-raises the first failure, as rmtree would
+    for d in reversed(dirs): # Every child appears after its parent in dirs
+        os.rmdir(d)
+
+class FileOperationSignals(QObject):
+    operation_finished = pyqtSignal(str, bool, str) # (operation name, success, message)
+    cut_pasted = pyqtSignal(object) # clipboard dict of a cut that moved at least one item
+
+class _FileOpTask(QRunnable):
+    """Runs the disk I/O half of a file operation on a pool thread and reports the result."""
+    def __init__(self, operation_name: str, fn, args: tuple, signals: FileOperationSignals):
+        super().__init__()
+        self.operation_name = operation_name
+        self.fn = fn
+        self.args = args
+        self.signals = signals
+
+    def run(self):
+        try:
+            success, message = self.fn(*self.args)
+        except Exception as e:
+            logger.error(f"{self.operation_name} failed: {e}", exc_info=True)
+            success, message = False, f"{self.operation_name} failed: {e}"
+        self.signals.operation_finished.emit(self.operation_name, success, message)
+
 class FileOperationService:
     def __init__(self, security_srv=security_manager):
         self.security_service = security_srv
         self.clipboard = [] # Very basic internal clipboard {action: 'copy'/'cut', paths: []}
+        # Delete and paste confirm on the caller's (GUI) thread, then do their I/O on the pool;
+        # results arrive through signals.operation_finished
+        self.signals = FileOperationSignals()
+        self.signals.cut_pasted.connect(self._clear_clipboard_after_cut) # Queued back to the GUI thread
         logger.info("FileOperationService initialized.")
 
+    def _start_background(self, operation_name: str, fn, *args):
+        QThreadPool.globalInstance().start(_FileOpTask(operation_name, fn, args, self.signals))
+
     def delete_items(self, paths: list[str], parent_widget=None) -> tuple[bool, str]:
         if not paths:
             return False, "No items selected for deletion."
@@ -28,16 +141,25 @@ class FileOperationService:
             logger.info("Deletion cancelled by user.")
             return False, "Deletion cancelled by user."
 
+        self._start_background("Delete", self._delete_paths, list(paths))
+        return True, f"Deleting {len(paths)} item(s)..."
+
+    def _delete_paths(self, paths: list[str]) -> tuple[bool, str]:
         deleted_count = 0
         errors = []
         for path_item in paths:
             try:
-                if os.path.isfile(path_item) or os.path.islink(path_item):
+                # One lstat() instead of isfile/islink/isdir probes; links are removed, never followed
+                try:
+                    mode = os.lstat(path_item).st_mode
+                except FileNotFoundError:
+                    mode = 0
+                if stat.S_ISREG(mode) or stat.S_ISLNK(mode):
                     os.remove(path_item)
                     logger.debug(f"Deleted file: {path_item}")
                     deleted_count += 1
-                elif os.path.isdir(path_item):
-                    shutil.rmtree(path_item)
+                elif stat.S_ISDIR(mode):
+                    _parallel_rmtree(path_item)
                     logger.debug(f"Deleted directory: {path_item}")
                     deleted_count += 1
                 else:
@@ -133,14 +255,14 @@ class FileOperationService:
 
         new_folder_path = os.path.join(parent_dir, folder_name)
 
-        if os.path.exists(new_folder_path):
-            logger.error(f"Create folder failed: Item '{folder_name}' already exists.")
-            return False, f"A file or folder named '{folder_name}' already exists."
-        
+        # Single-level mkdir; an existing item surfaces as FileExistsError, no separate exists() probe
         try:
-            os.makedirs(new_folder_path)
+            os.mkdir(new_folder_path)
             logger.info(f"Folder '{new_folder_path}' created successfully.")
             return True, f"Folder '{folder_name}' created."
+        except FileExistsError:
+            logger.error(f"Create folder failed: Item '{folder_name}' already exists.")
+            return False, f"A file or folder named '{folder_name}' already exists."
         except Exception as e:
             logger.error(f"Error creating folder '{new_folder_path}': {e}", exc_info=True)
             return False, f"Error creating folder: {e}"
@@ -175,20 +297,27 @@ class FileOperationService:
         if not source_paths:
             return False, "No source paths in clipboard."
 
-        success_count = 0
         errors = []
+        plan = [] # (src, dst, base name, src_is_dir, mode of an existing dst to remove first or None)
 
         for src_path in source_paths:
-            if not os.path.exists(src_path):
-                errors.append(f"Source item no longer exists: {os.path.basename(src_path)}")
+            base_name = os.path.basename(src_path) # Shared by the destination path and every message below
+            try:
+                src_is_dir = stat.S_ISDIR(os.stat(src_path).st_mode)
+            except OSError:
+                errors.append(f"Source item no longer exists: {base_name}")
                 logger.warning(f"Paste source missing: {src_path}")
                 continue
 
-            base_name = os.path.basename(src_path)
             dst_path = os.path.join(destination_dir, base_name)
 
+            try:
+                dst_mode = os.lstat(dst_path).st_mode
+            except FileNotFoundError:
+                dst_mode = None
+
             # Handle name collisions (simple overwrite confirmation, could be more advanced)
-            if os.path.exists(dst_path):
+            if dst_mode is not None:
                 if not self.security_service.request_confirmation(
                     "Confirm Overwrite",
                     f"'{base_name}' already exists in the destination. Overwrite?",
@@ -198,22 +327,43 @@ class FileOperationService:
                     errors.append(f"Skipped overwrite of {base_name}")
                     logger.info(f"Paste overwrite skipped for {base_name}")
                     continue
-                else: # If confirmed, remove existing destination to allow overwrite by copy/move
-                    try:
-                        if os.path.isdir(dst_path): shutil.rmtree(dst_path)
-                        else: os.remove(dst_path)
-                    except Exception as e:
-                        errors.append(f"Error removing existing '{base_name}' for overwrite: {e}")
-                        logger.error(f"Paste overwrite removal error for '{dst_path}': {e}", exc_info=True)
-                        continue
+            plan.append((src_path, dst_path, base_name, src_is_dir, dst_mode))
 
+        if not plan:
+            msg = f"Successfully {action}ed 0 of {len(source_paths)} item(s)."
+            if errors:
+                msg += "\nErrors occurred:\n" + "\n".join(errors)
+            logger.info(msg)
+            return False, msg
+
+        # A cut keeps its clipboard until the moves finish, so it can be retried if every one fails
+        self._start_background("Paste", self._paste_planned, action, plan, len(source_paths), errors, self.clipboard)
+        return True, f"Pasting {len(plan)} item(s)..."
+
+    def _clear_clipboard_after_cut(self, pasted_clipboard: dict):
+        if self.clipboard is pasted_clipboard: # Unless something new was copied/cut meanwhile
+            self.clipboard = []
+            logger.info("Clipboard cleared after cut operation.")
+
+    def _paste_planned(self, action: str, plan: list[tuple], total: int, errors: list[str],
+                       clipboard: dict) -> tuple[bool, str]:
+        success_count = 0
+        for src_path, dst_path, base_name, src_is_dir, dst_mode in plan:
+            if dst_mode is not None: # Confirmed overwrite: remove existing destination to allow overwrite by copy/move
+                try:
+                    if stat.S_ISDIR(dst_mode): _parallel_rmtree(dst_path)
+                    else: os.remove(dst_path)
+                except Exception as e:
+                    errors.append(f"Error removing existing '{base_name}' for overwrite: {e}")
+                    logger.error(f"Paste overwrite removal error for '{dst_path}': {e}", exc_info=True)
+                    continue
 
             try:
                 if action == 'copy':
-                    if os.path.isdir(src_path):
-                        shutil.copytree(src_path, dst_path)
+                    if src_is_dir:
+                        _parallel_copytree(src_path, dst_path)
                     else:
-                        shutil.copy2(src_path, dst_path) # copy2 preserves metadata
+                        _fast_copy2(src_path, dst_path) # Preserves metadata like copy2
                     logger.debug(f"Copied '{src_path}' to '{dst_path}'")
                 elif action == 'cut':
                     shutil.move(src_path, dst_path)
@@ -223,14 +373,12 @@ class FileOperationService:
                 errors.append(f"Error {action}ing {base_name}: {e}")
                 logger.error(f"Error {action}ing '{src_path}' to '{dst_path}': {e}", exc_info=True)
 
-        if action == 'cut': # Clear clipboard after successful cut and paste
-            if not errors or success_count > 0 : # Only clear if at least some operation might have happened
-                self.clipboard = [] 
-                logger.info("Clipboard cleared after cut operation.")
-        
-        msg = f"Successfully {action}ed {success_count} of {len(source_paths)} item(s)."
+        if action == 'cut' and success_count > 0:
+            self.signals.cut_pasted.emit(clipboard)
+
+        msg = f"Successfully {action}ed {success_count} of {total} item(s)."
         if errors:
             msg += "\nErrors occurred:\n" + "\n".join(errors)
         
         logger.info(msg)
-        return not errors or success_count > 0, msg
\ No newline at end of file
+        return not errors or success_count > 0, msg
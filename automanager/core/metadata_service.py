@@ -1,6 +1,7 @@
 import sqlite3
 import os
 import logging
+import threading
 from PyQt6.QtCore import QStandardPaths, QCoreApplication
 
 logger = logging.getLogger("automgr.core.metadata_service")
@@ -44,6 +45,8 @@ class MetadataService:
         logger.info(f"MetadataService: Database path set to: {self.db_path}")
         
         self._conn = None
+        # Reads/writes come from a UI worker thread as well as the GUI thread; one lock serializes the shared connection
+        self._lock = threading.RLock()
         try:
             self._ensure_db_and_table()
             logger.info("MetadataService initialized successfully and database table ensured.")
@@ -54,7 +57,7 @@ class MetadataService:
     def _get_connection(self) -> sqlite3.Connection | None:
         if self._conn is None:
             try:
-                self._conn = sqlite3.connect(self.db_path, timeout=10) 
+                self._conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False) 
                 self._conn.row_factory = sqlite3.Row 
                 self._conn.execute("PRAGMA journal_mode=WAL;")
                 logger.debug("New SQLite connection established.")
@@ -87,79 +90,101 @@ class MetadataService:
             raise
 
     def get_metadata(self, file_path: str) -> dict | None:
-        abs_path = os.path.abspath(file_path)
-        try:
-            conn = self._get_connection()
-            if not conn: return None
-
-            cursor = conn.cursor()
-            cursor.execute("SELECT tags, notes FROM file_metadata WHERE file_path = ?", (abs_path,))
-            row = cursor.fetchone()
-            if row:
-                tags_list = row['tags'].split(',') if row['tags'] else []
-                return {'tags': tags_list, 'notes': row['notes']}
-            return None
-        except sqlite3.Error as e:
-            logger.error(f"Error retrieving metadata for '{abs_path}': {e}", exc_info=True)
-            return None
+        with self._lock:
+            abs_path = os.path.abspath(file_path)
+            try:
+                conn = self._get_connection()
+                if not conn: return None
+
+                cursor = conn.cursor()
+                cursor.execute("SELECT tags, notes FROM file_metadata WHERE file_path = ?", (abs_path,))
+                row = cursor.fetchone()
+                if row:
+                    tags_list = row['tags'].split(',') if row['tags'] else []
+                    return {'tags': tags_list, 'notes': row['notes']}
+                return None
+            except sqlite3.Error as e:
+                logger.error(f"Error retrieving metadata for '{abs_path}': {e}", exc_info=True)
+                return None
 
     def save_metadata(self, file_path: str, tags: list[str] | None = None, note_text: str | None = None):
-        abs_path = os.path.abspath(file_path)
-        try:
-            conn = self._get_connection()
-            if not conn: return
-
-            cursor = conn.cursor()
-            existing_meta = self.get_metadata(abs_path)
-
-            if existing_meta is None: # New entry
-                tags_to_save_str = ",".join(tag.strip() for tag in tags if tag.strip()) if tags is not None else ""
-                note_to_save = note_text if note_text is not None else ""
-                
-                cursor.execute('''
-                    INSERT INTO file_metadata (file_path, tags, notes, last_updated) 
-                    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-                ''', (abs_path, tags_to_save_str, note_to_save))
-                logger.info(f"Inserted new metadata for '{abs_path}'.")
-            else: # Existing entry
-                update_clauses = []
-                params = []
-
-                current_tags_str = ",".join(existing_meta.get('tags', []))
-                current_notes = existing_meta.get('notes', '')
-
-                if tags is not None:
-                    new_tags_str = ",".join(tag.strip() for tag in tags if tag.strip())
-                    if new_tags_str != current_tags_str:
-                        update_clauses.append("tags = ?")
-                        params.append(new_tags_str)
-                
-                if note_text is not None:
-                    if note_text != current_notes:
-                        update_clauses.append("notes = ?")
-                        params.append(note_text)
-                
-                if not update_clauses:
-                    logger.debug(f"No metadata values changed for '{abs_path}'. Update skipped.")
-                    return
-
-                update_clauses.append("last_updated = CURRENT_TIMESTAMP")
-                sql = f"UPDATE file_metadata SET {', '.join(update_clauses)} WHERE file_path = ?"
-                params.append(abs_path)
-                
-                cursor.execute(sql, tuple(params))
-                logger.info(f"Updated metadata for '{abs_path}'. Changed fields: {[c.split(' = ')[0] for c in update_clauses if 'CURRENT_TIMESTAMP' not in c]}.")
-            conn.commit()
-        except sqlite3.Error as e:
-            logger.error(f"Error saving metadata for '{abs_path}': {e}", exc_info=True)
-            if self._conn: self._conn.rollback()
+        with self._lock:
+            abs_path = os.path.abspath(file_path)
+            try:
+                conn = self._get_connection()
+                if not conn: return
 
-    def close(self):
-        if self._conn:
+                self._write_metadata(conn.cursor(), abs_path, tags, note_text)
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Error saving metadata for '{abs_path}': {e}", exc_info=True)
+                if self._conn: self._conn.rollback()
+
+    def save_many(self, items: dict[str, dict]):
+        """Saves several files' metadata in one transaction. Values are save_metadata keyword args."""
+        if not items: return
+        with self._lock:
             try:
-                self._conn.close()
-                logger.info("Metadata database connection closed.")
+                conn = self._get_connection()
+                if not conn: return
+
+                cursor = conn.cursor()
+                for file_path, fields in items.items():
+                    self._write_metadata(cursor, os.path.abspath(file_path), fields.get('tags'), fields.get('note_text'))
+                conn.commit()
             except sqlite3.Error as e:
-                logger.error(f"Error closing metadata database connection: {e}", exc_info=True)
-            finally:
-                self._conn = None
\ No newline at end of file
+                logger.error(f"Error saving metadata for {len(items)} file(s): {e}", exc_info=True)
+                if self._conn: self._conn.rollback()
+
+    def _write_metadata(self, cursor: sqlite3.Cursor, abs_path: str, tags: list[str] | None, note_text: str | None):
+        # Insert/update one row without committing; callers own the transaction
+        existing_meta = self.get_metadata(abs_path)
+
+        if existing_meta is None: # New entry
+            tags_to_save_str = ",".join(tag.strip() for tag in tags if tag.strip()) if tags is not None else ""
+            note_to_save = note_text if note_text is not None else ""
+        
+            cursor.execute('''
+                INSERT INTO file_metadata (file_path, tags, notes, last_updated) 
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            ''', (abs_path, tags_to_save_str, note_to_save))
+            logger.info(f"Inserted new metadata for '{abs_path}'.")
+        else: # Existing entry
+            update_clauses = []
+            params = []
+
+            current_tags_str = ",".join(existing_meta.get('tags', []))
+            current_notes = existing_meta.get('notes', '')
+
+            if tags is not None:
+                new_tags_str = ",".join(tag.strip() for tag in tags if tag.strip())
+                if new_tags_str != current_tags_str:
+                    update_clauses.append("tags = ?")
+                    params.append(new_tags_str)
+        
+            if note_text is not None:
+                if note_text != current_notes:
+                    update_clauses.append("notes = ?")
+                    params.append(note_text)
+        
+            if not update_clauses:
+                logger.debug(f"No metadata values changed for '{abs_path}'. Update skipped.")
+                return
+
+            update_clauses.append("last_updated = CURRENT_TIMESTAMP")
+            sql = f"UPDATE file_metadata SET {', '.join(update_clauses)} WHERE file_path = ?"
+            params.append(abs_path)
+        
+            cursor.execute(sql, tuple(params))
+            logger.info(f"Updated metadata for '{abs_path}'. Changed fields: {[c.split(' = ')[0] for c in update_clauses if 'CURRENT_TIMESTAMP' not in c]}.")
+
+    def close(self):
+        with self._lock:
+            if self._conn:
+                try:
+                    self._conn.close()
+                    logger.info("Metadata database connection closed.")
+                except sqlite3.Error as e:
+                    logger.error(f"Error closing metadata database connection: {e}", exc_info=True)
+                finally:
+                    self._conn = None
\ No newline at end of file
@@ -1,43 +1,199 @@
 import os
+import hashlib
 import logging
+import tempfile
 from PyQt6.QtWidgets import QLabel
-from PyQt6.QtGui import QPixmap, QImageReader # Using QImageReader for better format support and error handling
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage, QImageReader # Using QImageReader for better format support and error handling
+from PyQt6.QtCore import Qt, QSize, QObject, QRunnable, QThreadPool, QStandardPaths, pyqtSignal
 
 logger = logging.getLogger("automgr.previews.image")
 
+# Decoded images are kept at most this large; resizeEvent scales down from here
+THUMBNAIL_SIZE = QSize(1024, 1024)
+# Decoded thumbnails are also kept in QPixmapCache (LRU) so re-selecting an image skips disk and decode.
+# Qt's default 10 MB only fits a few 1024px pixmaps.
+PIXMAP_CACHE_LIMIT_KB = 128 * 1024
+# On-disk thumbnails past this total are pruned, least recently used first
+THUMBNAIL_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+def _thumbnail_cache_dir() -> str | None:
+    base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+    if not base:
+        return None
+    cache_dir = os.path.join(base, "thumbnails")
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError as e:
+        logger.warning(f"Thumbnail cache disabled, cannot create '{cache_dir}': {e}")
+        return None
+    QThreadPool.globalInstance().start(lambda: _prune_thumbnail_cache(cache_dir))
+    return cache_dir
+
+def _prune_thumbnail_cache(cache_dir: str, max_bytes: int = THUMBNAIL_CACHE_MAX_BYTES):
+    # Hits touch their file's mtime, so oldest mtime = least recently used
+    entries = []
+    total = 0
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        entries.append((st.st_mtime_ns, st.st_size, entry.path))
+                        total += st.st_size
+                except OSError:
+                    pass
+    except OSError as e:
+        logger.warning(f"Could not scan thumbnail cache '{cache_dir}': {e}")
+        return
+    if total <= max_bytes:
+        return
+    removed = 0
+    for _, size, path in sorted(entries):
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+        if total <= max_bytes:
+            break
+    logger.info(f"Pruned {removed} thumbnail(s) from '{cache_dir}'")
+
+def _thumbnail_key(image_path: str) -> str | None:
+    # A changed file gets a new key, so stale thumbnails are never read back
+    try:
+        st = os.stat(image_path)
+    except OSError:
+        return None
+    return f"{image_path}\0{st.st_mtime_ns}\0{st.st_size}\0{THUMBNAIL_SIZE.width()}x{THUMBNAIL_SIZE.height()}"
+
+def _thumbnail_cache_path(cache_dir: str, key: str) -> str:
+    return os.path.join(cache_dir, hashlib.sha1(key.encode('utf-8', 'surrogateescape')).hexdigest() + ".png")
+
+def _for_display(image: QImage) -> QImage:
+    # Convert to the raster pixmap formats here, so QPixmap.fromImage on the GUI thread is a plain copy
+    fmt = QImage.Format.Format_ARGB32_Premultiplied if image.hasAlphaChannel() else QImage.Format.Format_RGB32
+    return image if image.format() == fmt else image.convertToFormat(fmt)
+
+class _ImageSignals(QObject):
+    decoded = pyqtSignal(int, str, object, str) # (request id, path, QImage or None, error text)
+
+class _ImageDecodeTask(QRunnable):
+    """Decodes an image on a pool thread, reusing or writing the on-disk thumbnail."""
+    def __init__(self, request_id: int, image_path: str, key: str | None, cache_dir: str | None, signals: _ImageSignals):
+        super().__init__()
+        self.request_id = request_id
+        self.image_path = image_path
+        self.key = key
+        self.cache_dir = cache_dir
+        self.signals = signals
+
+    def run(self):
+        try:
+            image, error = self._decode()
+            if image is not None:
+                image = _for_display(image)
+        except Exception as e:
+            logger.error(f"Unexpected error decoding image {self.image_path}: {e}", exc_info=True)
+            image, error = None, f"Failed to read image data:\n{os.path.basename(self.image_path)}"
+        self.signals.decoded.emit(self.request_id, self.image_path, image, error)
+
+    def _decode(self) -> tuple[QImage | None, str]:
+        name = os.path.basename(self.image_path)
+        cache_path = _thumbnail_cache_path(self.cache_dir, self.key) if self.cache_dir and self.key else None
+        if cache_path and os.path.exists(cache_path):
+            cached = QImage(cache_path)
+            if not cached.isNull():
+                logger.debug(f"Thumbnail cache hit for {self.image_path}")
+                try:
+                    os.utime(cache_path) # Mark as recently used for _prune_thumbnail_cache
+                except OSError:
+                    pass
+                return cached, ""
+
+        reader = QImageReader(self.image_path)
+        reader.setAutoTransform(True) # Honour EXIF orientation
+        if not reader.canRead():
+            error_msg = reader.errorString() if reader.errorString() else "Unsupported image format or file corrupted."
+            logger.warning(f"Cannot read image {self.image_path}: {error_msg}")
+            return None, f"Cannot load image:\n{name}\n{error_msg}"
+
+        # Let the decoder produce the target size directly (JPEG scales during the IDCT) instead of
+        # decoding full resolution and scaling down. THUMBNAIL_SIZE is square, so EXIF rotation can't break the fit.
+        source_size = reader.size()
+        downscaled = source_size.isValid() and (source_size.width() > THUMBNAIL_SIZE.width()
+                                                or source_size.height() > THUMBNAIL_SIZE.height())
+        if downscaled:
+            reader.setScaledSize(source_size.scaled(THUMBNAIL_SIZE, Qt.AspectRatioMode.KeepAspectRatio))
+
+        image = reader.read()
+        if image.isNull():
+            logger.error(f"Failed to read image data from {self.image_path}: {reader.errorString()}")
+            return None, f"Failed to read image data:\n{name}"
+
+        # Only downscaled images are worth caching; small ones decode as fast as the PNG would
+        if downscaled and cache_path:
+            self._write_cache_file(image, cache_path)
+        return image, ""
+
+    def _write_cache_file(self, image: QImage, cache_path: str):
+        # Written under a temp name and renamed, so a concurrent load or a crash never sees a partial PNG
+        try:
+            fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+            os.close(fd)
+        except OSError as e:
+            logger.debug(f"Could not create thumbnail temp file in {self.cache_dir}: {e}")
+            return
+        try:
+            if image.save(tmp_path, "PNG"):
+                os.replace(tmp_path, cache_path)
+                return
+            logger.debug(f"Could not write thumbnail cache file {cache_path}")
+        except OSError as e:
+            logger.debug(f"Could not move thumbnail into place at {cache_path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
 class ImagePreviewWidget(QLabel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setText("Image Preview Area")
         self.setMinimumSize(QSize(100,100))
-        self._original_pixmap = None # Store the full-resolution pixmap
+        self._original_pixmap = None # Decoded image, at most THUMBNAIL_SIZE
         self._current_image_path = None
+        self._request_id = 0 # Bumped per load/clear so late decodes for an old selection are dropped
+        self._thumbnail_key = None # QPixmapCache key of the image being loaded
+        if QPixmapCache.cacheLimit() < PIXMAP_CACHE_LIMIT_KB:
+            QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
+        self._cache_dir = _thumbnail_cache_dir()
+        self._signals = _ImageSignals(self)
+        self._signals.decoded.connect(self._on_image_decoded)
 
     def load_image(self, image_path):
         self.clear_preview() # Clear previous
         self._current_image_path = image_path
         logger.debug(f"Loading image: {image_path}")
+        key = _thumbnail_key(image_path)
+        if key is not None:
+            pixmap = QPixmapCache.find(key)
+            if pixmap is not None and not pixmap.isNull():
+                self._original_pixmap = pixmap
+                self._display_scaled_pixmap()
+                return
+        self._thumbnail_key = key
+        self.setText(f"Loading {os.path.basename(image_path)}...")
+        QThreadPool.globalInstance().start(
+            _ImageDecodeTask(self._request_id, image_path, key, self._cache_dir, self._signals))
 
-        reader = QImageReader(image_path)
-        if not reader.canRead():
-            error_msg = reader.errorString() if reader.errorString() else "Unsupported image format or file corrupted."
-            self.setText(f"Cannot load image:\n{os.path.basename(image_path)}\n{error_msg}")
-            logger.warning(f"Cannot read image {image_path}: {error_msg}")
-            self._original_pixmap = None
+    def _on_image_decoded(self, request_id: int, image_path: str, image, error: str):
+        if request_id != self._request_id:
             return
-        
-        # Optionally set quality for formats like JPEG
-        # reader.setQuality(100) 
-        
-        # For large images, consider QImageReader.setScaledSize() to load a pre-scaled version
-        # to save memory if the display area is much smaller.
-        # However, for best quality on resize, load full then scale.
-        image = reader.read()
-        if image.isNull():
-            self.setText(f"Failed to read image data:\n{os.path.basename(image_path)}")
-            logger.error(f"Failed to read image data from {image_path}")
+        if image is None:
+            self.setText(error)
             self._original_pixmap = None
             return
 
@@ -48,6 +204,8 @@ class ImagePreviewWidget(QLabel):
             self._original_pixmap = None
             return
 
+        if self._thumbnail_key is not None:
+            QPixmapCache.insert(self._thumbnail_key, self._original_pixmap)
         self._display_scaled_pixmap()
 
 
@@ -76,6 +234,8 @@ class ImagePreviewWidget(QLabel):
         self.setText("Image Preview Area")
         self._original_pixmap = None
         self._current_image_path = None
+        self._thumbnail_key = None
+        self._request_id += 1
         logger.debug("Image preview cleared.")
 
     def resizeEvent(self, a0):
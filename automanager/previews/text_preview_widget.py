@@ -8,6 +8,8 @@ logger = logging.getLogger("automgr.previews.text")
 
 class TextPreviewWidget(QTextEdit):
     MAX_FILE_SIZE_BYTES = 5 * 1024 * 1024  # 5MB limit
+    MAX_PREVIEW_LINES = 10000 # Laying out more lines than this makes the preview slow to appear
+    READ_CHUNK_BYTES = 64 * 1024
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -39,25 +41,49 @@ class TextPreviewWidget(QTextEdit):
             #     logger.debug(f"UTF-8 decode failed for {file_path}, trying {encoding}")
 
 
-            with open(file_path, 'r', encoding=encoding, errors='replace') as f:
-                # Check file size before reading full content
-                f.seek(0, 2) # Go to end of file
-                file_size = f.tell()
-                f.seek(0) # Reset to beginning
-
-                if file_size > self.MAX_FILE_SIZE_BYTES:
-                    content_sample = f.read(self.MAX_FILE_SIZE_BYTES)
-                    self.setPlainText(content_sample + f"\n\n--- File truncated (actual size: {file_size // 1024} KB) ---")
-                    logger.info(f"Text file {file_path} truncated for preview (size: {file_size} bytes).")
-                else:
-                    content_sample = f.read()
-                    self.setPlainText(content_sample)
+            data, file_size, truncated = self._read_preview_bytes(file_path)
+            text = data.decode(encoding, errors='replace')
+            if truncated:
+                shown_lines = data.count(b"\n") + (1 if data and not data.endswith(b"\n") else 0)
+                text += f"\n\n--- File truncated (showing {shown_lines} lines, actual size: {file_size // 1024} KB) ---"
+                logger.info(f"Text file {file_path} truncated for preview (size: {file_size} bytes).")
+            self.setPlainText(text)
             # TODO: Add syntax highlighting using QSyntaxHighlighter or Pygments
         except Exception as e:
             self.setPlainText(f"Error reading text file:\n{os.path.basename(file_path)}\n\n{e}")
             logger.error(f"Error reading text file {file_path}: {e}", exc_info=True)
 
 
+    def _read_preview_bytes(self, file_path) -> tuple[bytes, int, bool]:
+        """Returns (data, file size, truncated), stopping at MAX_FILE_SIZE_BYTES or MAX_PREVIEW_LINES.
+
+        Raw os.read() chunks with C-level newline counting; no file object, buffer or decoder."""
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            file_size = os.fstat(fd).st_size
+            if hasattr(os, 'posix_fadvise'): # Not on Windows/macOS
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            chunks = []
+            budget = self.MAX_FILE_SIZE_BYTES
+            lines_left = self.MAX_PREVIEW_LINES
+            while budget > 0:
+                chunk = os.read(fd, min(self.READ_CHUNK_BYTES, budget))
+                if not chunk:
+                    return b"".join(chunks), file_size, False
+                newlines = chunk.count(b"\n")
+                if newlines >= lines_left: # Line cap reached inside this chunk; cut after the last allowed line
+                    end = -1
+                    for _ in range(lines_left):
+                        end = chunk.find(b"\n", end + 1)
+                    chunks.append(chunk[:end + 1])
+                    return b"".join(chunks), file_size, end + 1 < len(chunk) or bool(os.read(fd, 1))
+                chunks.append(chunk)
+                budget -= len(chunk)
+                lines_left -= newlines
+            return b"".join(chunks), file_size, bool(os.read(fd, 1))
+        finally:
+            os.close(fd)
+
     def clear_preview(self):
         self.clear() # Clears text content
         # self.setPlaceholderText("Text/Code Preview Area") # Placeholder re-appears automatically
@@ -1,13 +1,14 @@
 import os
 import logging
+import functools
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QListView, QMenu, QMessageBox,
                              QInputDialog, QApplication, QSizePolicy)
 from PyQt6.QtGui import QFileSystemModel, QFontMetrics
 from PyQt6.QtCore import (QDir, pyqtSignal, QModelIndex, Qt, QUrl, QMimeData,
-                          QPoint, QSize, QItemSelection, QTimer, QItemSelectionModel) # Added QTimer
-from PyQt6.QtGui import QDesktopServices, QIcon, QAction, QKeySequence
+                          QPoint, QSize, QItemSelection, QItemSelectionModel)
+from PyQt6.QtGui import QDesktopServices, QAction, QKeySequence
 
-from .icon_provider import IconProvider # Import the new icon provider
+from .icon_provider import IconProvider, empty_icon, themed_icon # Import the new icon provider
 
 logger = logging.getLogger("automgr.ui.file_browser")
 
@@ -19,11 +20,15 @@ class FileBrowserPane(QWidget):
 
     TARGET_ICON_SIZE = QSize(48, 48)
     GRID_CELL_WIDTH = 90
+    _cached_grid_size: QSize | None = None # Shared by all panes, computed on first instantiation
 
     def __init__(self, file_op_service=None, parent=None):
         super().__init__(parent)
         self.file_op_service = file_op_service
+        self._background_op_titles: dict[str, tuple[str, str]] = {} # operation name -> (success, error) box titles
+        self._connect_file_op_service(file_op_service)
         self.current_path = QDir.homePath()
+        self._pending_selection: list[str] = [] # Paths to select once the target directory has loaded
         logger.info(f"FileBrowserPane initialized for Icon View. Initial path: {self.current_path}")
 
         layout = QVBoxLayout(self)
@@ -33,6 +38,7 @@ class FileBrowserPane(QWidget):
         self.model.setIconProvider(IconProvider()) # Set the custom icon provider
         self.model.setRootPath(QDir.rootPath())
         self.model.setFilter(QDir.Filter.AllEntries | QDir.Filter.Hidden | QDir.Filter.System | QDir.Filter.NoDotAndDotDot)
+        self.model.directoryLoaded.connect(self._on_directory_loaded)
 
         self.list_view = QListView(self)
         self.list_view.setModel(self.model)
@@ -42,17 +48,18 @@ class FileBrowserPane(QWidget):
         self.list_view.setIconSize(self.TARGET_ICON_SIZE)
 
         # Calculate grid size after QApplication is created
-        font_metrics = QFontMetrics(QApplication.font())
-        text_margin_vertical = 2
-        icon_text_spacing = 8
-        max_filename_lines = 2
-        grid_cell_height = (self.TARGET_ICON_SIZE.height() +
-                            text_margin_vertical +
-                            icon_text_spacing +
-                            (font_metrics.height() * max_filename_lines) +
-                            text_margin_vertical + 5)
-        target_grid_size = QSize(self.GRID_CELL_WIDTH, int(grid_cell_height))
-        self.list_view.setGridSize(target_grid_size)
+        if FileBrowserPane._cached_grid_size is None:
+            font_metrics = QFontMetrics(QApplication.font())
+            text_margin_vertical = 2
+            icon_text_spacing = 8
+            max_filename_lines = 2
+            grid_cell_height = (self.TARGET_ICON_SIZE.height() +
+                                text_margin_vertical +
+                                icon_text_spacing +
+                                (font_metrics.height() * max_filename_lines) +
+                                text_margin_vertical + 5)
+            FileBrowserPane._cached_grid_size = QSize(self.GRID_CELL_WIDTH, int(grid_cell_height))
+        self.list_view.setGridSize(FileBrowserPane._cached_grid_size)
 
         self.list_view.setResizeMode(QListView.ResizeMode.Adjust)
         self.list_view.setMovement(QListView.Movement.Static)
@@ -81,6 +88,7 @@ class FileBrowserPane(QWidget):
 
     def select_files_by_paths(self, paths_to_select: list[str]):
         if not paths_to_select:
+            self._pending_selection = []
             if self.list_view.selection_model(): self.list_view.selection_model().clear()
             logger.debug("select_files_by_paths called with empty list, selection cleared.")
             return
@@ -94,13 +102,25 @@ class FileBrowserPane(QWidget):
 
         if norm_first_file_dir != norm_current_path:
             logger.info(f"Target directory '{norm_first_file_dir}' for selection is different from current '{norm_current_path}'. Navigating...")
+            # Defer selection until the model reports the new directory as loaded (see _on_directory_loaded)
+            self._pending_selection = paths_to_select
             self.set_current_path(norm_first_file_dir) # This will change self.current_path
-            # Use QTimer to defer selection until after path change and model update are processed
-            QTimer.singleShot(100, lambda: self._perform_selection(paths_to_select))
-            return # Selection will happen in _perform_selection
-
+            root_index = self.model.index(self.current_path)
+            if self._pending_selection and self.model.rowCount(root_index) > 0:
+                # Directory was already populated by the model, directoryLoaded won't fire again
+                pending, self._pending_selection = self._pending_selection, []
+                self._perform_selection(pending)
+            return # Selection will happen in _on_directory_loaded
+
+        self._pending_selection = []
         self._perform_selection(paths_to_select) # If already in correct dir, select immediately
 
+    def _on_directory_loaded(self, path: str):
+        if self._pending_selection and QDir.cleanPath(path) == QDir.cleanPath(self.current_path):
+            logger.debug(f"Directory '{path}' loaded, performing pending selection.")
+            pending, self._pending_selection = self._pending_selection, []
+            self._perform_selection(pending)
+
     def _perform_selection(self, paths_to_select: list[str]):
         """Internal method to actually perform the selection. Called after potential path change."""
         logger.debug(f"_perform_selection called for {len(paths_to_select)} paths in '{self.current_path}'.")
@@ -109,14 +129,18 @@ class FileBrowserPane(QWidget):
             logger.error("Cannot select files: No selection model found in _perform_selection.")
             return
 
-        selection_model.clear()
-        selection_flags = QItemSelectionModel.SelectionFlag.Select | QItemSelectionModel.SelectionFlag.Rows
+        # Collect matches into one QItemSelection so the model emits a single selectionChanged
+        new_selection = QItemSelection()
         successful_selections = 0
         first_selected_index = QModelIndex() # To scroll to
 
-        for path_str in paths_to_select:
+        norm_current_path = self.current_path # Already cleaned by set_current_path
+        # Normalize each target's parent dir once so the loop below is a plain string compare
+        dir_path_pairs = [(QDir.cleanPath(os.path.dirname(p)), p) for p in paths_to_select]
+
+        for parent_dir, path_str in dir_path_pairs:
             # Only select if the file is directly in the current view's directory
-            if QDir.cleanPath(os.path.dirname(path_str)) == QDir.cleanPath(self.current_path):
+            if parent_dir == norm_current_path:
                 file_name = os.path.basename(path_str)
                 # QFileSystemModel.index() takes full path or path relative to its own root.
                 # We are providing absolute path.
@@ -131,7 +155,7 @@ class FileBrowserPane(QWidget):
                     if self.model.filePath(index) == path_str:
                         if not first_selected_index.isValid():
                             first_selected_index = index
-                        selection_model.select(index, selection_flags)
+                        new_selection.select(index, index)
                         successful_selections += 1
                         logger.debug(f"Selected file via path: {path_str}")
                     else:
@@ -141,6 +165,12 @@ class FileBrowserPane(QWidget):
             else:
                 logger.warning(f"Cannot select '{os.path.basename(path_str)}': Not in current directory '{self.current_path}'.")
 
+        if not new_selection.isEmpty():
+            selection_model.select(new_selection,
+                                   QItemSelectionModel.SelectionFlag.ClearAndSelect | QItemSelectionModel.SelectionFlag.Rows)
+        elif selection_model.hasSelection():
+            selection_model.clear()
+
         if first_selected_index.isValid():
             self.list_view.scrollTo(first_selected_index, QListView.ScrollHint.EnsureVisible)
 
@@ -162,10 +192,10 @@ class FileBrowserPane(QWidget):
     def _setup_standard_shortcuts(self):
         logger.debug("Setting up standard shortcuts.")
         shortcuts = [
-            (QKeySequence.StandardKey.Delete, lambda: self._handle_delete(self.get_selected_items_paths())),
-            (QKeySequence.StandardKey.Copy, lambda: self._handle_copy(self.get_selected_items_paths())),
-            (QKeySequence.StandardKey.Cut, lambda: self._handle_cut(self.get_selected_items_paths())),
-            (QKeySequence.StandardKey.Paste, lambda: self._handle_paste(self.current_path)),
+            (QKeySequence.StandardKey.Delete, self._shortcut_delete),
+            (QKeySequence.StandardKey.Copy, self._shortcut_copy),
+            (QKeySequence.StandardKey.Cut, self._shortcut_cut),
+            (QKeySequence.StandardKey.Paste, self._shortcut_paste),
         ]
         for key_seq, slot in shortcuts:
             action = QAction(self)
@@ -174,8 +204,26 @@ class FileBrowserPane(QWidget):
             self.addAction(action)
         logger.debug("Standard shortcuts set up.")
 
+    # Shortcut slots resolve the selection at trigger time
+    def _shortcut_delete(self):
+        self._handle_delete(self.get_selected_items_paths())
+
+    def _shortcut_copy(self):
+        self._handle_copy(self.get_selected_items_paths())
+
+    def _shortcut_cut(self):
+        self._handle_cut(self.get_selected_items_paths())
+
+    def _shortcut_paste(self):
+        self._handle_paste(self.current_path)
+
     def set_file_operation_service(self, service):
+        if service is self.file_op_service:
+            return # Already connected in __init__ or by an earlier call
+        if self.file_op_service is not None:
+            self.file_op_service.signals.operation_finished.disconnect(self._on_file_operation_finished)
         self.file_op_service = service
+        self._connect_file_op_service(service)
         logger.debug(f"FileOperationService instance {'set' if service else 'cleared'}.")
 
     def set_current_path(self, path_str: str):
@@ -223,11 +271,13 @@ class FileBrowserPane(QWidget):
         else:
             self.status_message_signal.emit("No items selected.")
 
-    def get_selected_items_paths(self) -> list[str]:
+    def get_selected_indexes(self) -> list[QModelIndex]:
         selection_model = self.list_view.selectionModel()
         if not selection_model: return []
-        selected_indexes = selection_model.selectedIndexes() # QListView's selectedIndexes() is direct
-        paths = [self.model.filePath(index) for index in selected_indexes]
+        return selection_model.selectedIndexes() # QListView's selectedIndexes() is direct
+
+    def get_selected_items_paths(self) -> list[str]:
+        paths = [self.model.filePath(index) for index in self.get_selected_indexes()]
         return paths
 
     def _on_double_clicked(self, index: QModelIndex):
@@ -249,7 +299,8 @@ class FileBrowserPane(QWidget):
                 logger.info(f"Opened file with default application: '{file_path}'")
 
     def _open_context_menu(self, position: QPoint):
-        selected_paths = self.get_selected_items_paths()
+        selected_indexes = self.get_selected_indexes()
+        selected_paths = [self.model.filePath(index) for index in selected_indexes]
         index_under_mouse = self.list_view.indexAt(position)
 
         target_dir_for_creation = self.current_path
@@ -258,42 +309,41 @@ class FileBrowserPane(QWidget):
 
         menu = QMenu(self)
 
-        def add_menu_action(text, slot, icon_theme_name=None, shortcut=None, enabled=True):
-            icon = QIcon.fromTheme(icon_theme_name, QIcon()) if icon_theme_name else QIcon()
-            action = QAction(icon, text, menu)
-            if slot: action.triggered.connect(slot)
+        def add_menu_action(text, handler, handler_arg, icon_theme_name=None, shortcut=None, enabled=True, target_menu=None):
+            target_menu = target_menu or menu
+            icon = themed_icon(icon_theme_name) if icon_theme_name else empty_icon()
+            action = QAction(icon, text, target_menu)
+            # Context travels with the action and is read back in _on_context_action_triggered
+            action.setData(functools.partial(handler, handler_arg))
+            action.triggered.connect(self._on_context_action_triggered)
             if shortcut: action.setShortcut(QKeySequence(shortcut))
             action.setEnabled(enabled)
-            menu.addAction(action)
+            target_menu.addAction(action)
             return action
 
         if selected_paths:
-            add_menu_action("Open", lambda: self._handle_open_selected(selected_paths), "document-open")
+            add_menu_action("Open", self._handle_open_selected, selected_paths, "document-open")
             if len(selected_paths) == 1:
-                add_menu_action("Rename...", lambda: self._handle_rename(selected_paths[0]), "edit-rename")
+                add_menu_action("Rename...", self._handle_rename, selected_paths[0], "edit-rename")
             menu.addSeparator()
-            add_menu_action("Copy", lambda: self._handle_copy(selected_paths), "edit-copy", QKeySequence.StandardKey.Copy)
-            add_menu_action("Cut", lambda: self._handle_cut(selected_paths), "edit-cut", QKeySequence.StandardKey.Cut)
+            add_menu_action("Copy", self._handle_copy, selected_paths, "edit-copy", QKeySequence.StandardKey.Copy)
+            add_menu_action("Cut", self._handle_cut, selected_paths, "edit-cut", QKeySequence.StandardKey.Cut)
             menu.addSeparator()
-            add_menu_action("Delete", lambda: self._handle_delete(selected_paths), "edit-delete", QKeySequence.StandardKey.Delete)
+            add_menu_action("Delete", self._handle_delete, selected_paths, "edit-delete", QKeySequence.StandardKey.Delete)
             menu.addSeparator()
 
         can_paste = self.file_op_service and self.file_op_service.get_clipboard_status().get('can_paste', False)
-        add_menu_action("Paste", lambda: self._handle_paste(target_dir_for_creation), "edit-paste", QKeySequence.StandardKey.Paste, enabled=can_paste)
+        add_menu_action("Paste", self._handle_paste, target_dir_for_creation, "edit-paste", QKeySequence.StandardKey.Paste, enabled=can_paste)
         menu.addSeparator()
-        add_menu_action("New Folder...", lambda: self._handle_create_folder(target_dir_for_creation), "folder-new")
-        add_menu_action("New File...", lambda: self._handle_create_file(target_dir_for_creation), "document-new")
+        add_menu_action("New Folder...", self._handle_create_folder, target_dir_for_creation, "folder-new")
+        add_menu_action("New File...", self._handle_create_file, target_dir_for_creation, "document-new")
 
         if selected_paths:
             menu.addSeparator()
-            llm_submenu = menu.addMenu(QIcon.fromTheme("system-search", QIcon()), "LLM Actions")
-            analyze_action = QAction("Analyze / Summarize Selection", llm_submenu)
-            analyze_action.triggered.connect(lambda: self._send_to_llm_for_analysis(selected_paths))
-            llm_submenu.addAction(analyze_action)
+            llm_submenu = menu.addMenu(themed_icon("system-search"), "LLM Actions")
+            add_menu_action("Analyze / Summarize Selection", self._send_to_llm_for_analysis, selected_paths, target_menu=llm_submenu)
             if len(selected_paths) == 1:
-                rename_sugg_action = QAction("Suggest New Name(s)", llm_submenu)
-                rename_sugg_action.triggered.connect(lambda: self._send_to_llm_for_rename_suggestion(selected_paths[0]))
-                llm_submenu.addAction(rename_sugg_action)
+                add_menu_action("Suggest New Name(s)", self._send_to_llm_for_rename_suggestion, selected_paths[0], target_menu=llm_submenu)
 
         viewport = self.list_view.viewport()
         if viewport:
@@ -301,12 +351,20 @@ class FileBrowserPane(QWidget):
         else:
             logger.error("ListView viewport not found, cannot show context menu.")
 
+    def _on_context_action_triggered(self):
+        action = self.sender()
+        if not isinstance(action, QAction):
+            return
+        action.data()() # The handler bound to its argument by add_menu_action
+
     def _send_to_llm_for_analysis(self, paths: list[str]):
         if not paths: return
         filenames = [os.path.basename(p) for p in paths]
         command = f"Analyze the following selected items: {', '.join(filenames)}. Provide a brief overview or interesting details."
-        if len(paths) == 1 and os.path.isfile(paths[0]):
-            command = f"Summarize or analyze the selected file: {os.path.basename(paths[0])}."
+        # Resolved here, after the menu closed; an index taken before menu.exec() may point at another row by now.
+        # The model's cached entry answers isDir without a stat.
+        if len(paths) == 1 and not self.model.isDir(self.model.index(paths[0])):
+            command = f"Summarize or analyze the selected file: {filenames[0]}."
         logger.info(f"Emitting LLM request for analysis: {command[:100]}...")
         self.request_llm_command_signal.emit(command, paths)
 
@@ -317,7 +375,20 @@ class FileBrowserPane(QWidget):
         logger.info(f"Emitting LLM request for rename suggestion: {command}")
         self.request_llm_command_signal.emit(command, [path])
 
-    def _handle_operation(self, operation_name: str, op_callable, success_msg: str, error_msg: str, *args):
+    def _connect_file_op_service(self, service):
+        if service is not None:
+            service.signals.operation_finished.connect(self._on_file_operation_finished)
+
+    def _on_file_operation_finished(self, operation_name: str, success: bool, message: str):
+        success_msg, error_msg = self._background_op_titles.get(operation_name, (operation_name, operation_name))
+        if success:
+            QMessageBox.information(self, success_msg, message)
+        else:
+            QMessageBox.warning(self, error_msg, message)
+        self.status_message_signal.emit(message)
+
+    def _handle_operation(self, operation_name: str, op_callable, success_msg: str, error_msg: str, *args,
+                          background: bool = False):
         if not self.file_op_service:
             QMessageBox.warning(self, "Service Error", "File Operation Service is not available.")
             logger.error(f"{operation_name} failed: FileOperationService not available.")
@@ -329,7 +400,10 @@ class FileBrowserPane(QWidget):
 
         success, message = op_callable(*actual_args)
 
-        if success:
+        if success and background:
+            # The op only started; its result box is shown by _on_file_operation_finished
+            self._background_op_titles[operation_name] = (success_msg, error_msg)
+        elif success:
             QMessageBox.information(self, success_msg, message)
         else:
             QMessageBox.warning(self, error_msg, message)
@@ -354,8 +428,8 @@ class FileBrowserPane(QWidget):
         if not paths: return
         logger.info(f"Handling 'Open' for {len(paths)} item(s). First: {paths[0]}")
         for path_item in paths:
-            index = self.model.index(path_item)
-            if index.isValid(): self._on_double_clicked(index)
+            index = self.model.index(path_item) # Resolved now; the model may have re-sorted while the menu was open
+            if index.isValid(): self._on_double_clicked(index) # Dispatches on model.isDir(index)
             else:
                 logger.warning(f"Invalid model index for path: '{path_item}'. Fallback open.")
                 if not QDesktopServices.openUrl(QUrl.fromLocalFile(path_item)):
@@ -364,7 +438,7 @@ class FileBrowserPane(QWidget):
     def _handle_delete(self, paths_to_delete: list[str]):
         if paths_to_delete and self.file_op_service:
             self._handle_operation("Delete", self.file_op_service.delete_items,
-                                   "Deletion Complete", "Deletion Error", paths_to_delete)
+                                   "Deletion Complete", "Deletion Error", paths_to_delete, background=True)
         elif not self.file_op_service:
             QMessageBox.warning(self, "Service Error", "File Operation Service is not available.")
         else:
@@ -428,4 +502,4 @@ class FileBrowserPane(QWidget):
             QMessageBox.warning(self, "Service Error", "File Operation Service is not available.")
             return
         self._handle_operation("Paste", self.file_op_service.paste_from_clipboard,
-                               "Paste Operation", "Paste Operation", destination_dir)
+                               "Paste Operation", "Paste Operation", destination_dir, background=True)
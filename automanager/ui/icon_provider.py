@@ -1,7 +1,22 @@
+import functools
 from PyQt6.QtWidgets import QFileIconProvider
 from PyQt6.QtGui import QIcon
 from PyQt6.QtCore import QFileInfo
 
+_EMPTY_ICON = None
+
+def empty_icon() -> QIcon:
+    """Shared null QIcon used as the fallback for QIcon.fromTheme lookups."""
+    global _EMPTY_ICON
+    if _EMPTY_ICON is None: # Created lazily, after QApplication exists
+        _EMPTY_ICON = QIcon()
+    return _EMPTY_ICON
+
+@functools.lru_cache(maxsize=64)
+def themed_icon(name: str) -> QIcon:
+    """QIcon.fromTheme with the result memoized per name, for the fixed UI icon set."""
+    return QIcon.fromTheme(name, empty_icon())
+
 class IconProvider(QFileIconProvider):
     """
     A custom icon provider that uses the system's icon theme but allows
@@ -12,7 +27,7 @@ class IconProvider(QFileIconProvider):
             fileInfo = type
             # For directories, always use the theme's folder icon.
             if fileInfo.isDir():
-                return QIcon.fromTheme("folder")
+                return QIcon.fromTheme("folder", empty_icon())
 
             # Get the file extension.
             ext = fileInfo.suffix().lower()
@@ -57,7 +72,7 @@ class IconProvider(QFileIconProvider):
             icon_name = ext_map.get(ext)
             
             if icon_name:
-                icon = QIcon.fromTheme(icon_name)
+                icon = QIcon.fromTheme(icon_name, empty_icon())
                 # If a specific icon was found and it's not null, use it.
                 if not icon.isNull():
                     return icon
@@ -1,16 +1,46 @@
 import os
+import re
+import codecs
+import html
 import logging
 import platform
-import json # For potential future structured output from terminal commands
-from PyQt6.QtWidgets import (QTabWidget, QWidget, QVBoxLayout, QTextEdit,
-                             QLineEdit, QPushButton, QHBoxLayout, QMessageBox, QApplication)
+from typing import TYPE_CHECKING
+from PyQt6.QtWidgets import (QTabWidget, QWidget, QVBoxLayout, QPlainTextEdit,
+                             QLineEdit, QPushButton, QHBoxLayout, QMessageBox)
 from PyQt6.QtCore import pyqtSignal, QProcess, QDir, Qt, QTimer # Added QTimer if needed
-from PyQt6.QtGui import QColor, QPalette, QIcon
+from PyQt6.QtGui import QColor, QTextCharFormat, QTextCursor
 
-from ..core.llm_service import LLMService
+from .icon_provider import themed_icon
+
+if TYPE_CHECKING:
+    from ..core.llm_service import LLMService
 
 logger = logging.getLogger("automgr.ui.llm_terminal")
 
+_SHELL_CMD_RE = re.compile(r'(?m)^[ \t]*SHELL_COMMAND:[ \t]*([^\n#]*)')
+
+_SHELL_CACHE: tuple[str, list[str]] | None = None
+
+def _get_shell() -> tuple[str, list[str]]:
+    """Returns (shell_program, args_for_command), determined once per process."""
+    global _SHELL_CACHE
+    if _SHELL_CACHE is None:
+        system = platform.system()
+        if system == "Windows":
+            shell_program = "cmd.exe"
+            shell_args = ["/c"]
+        elif system == "Darwin":
+            shell_program = os.environ.get("SHELL", "/bin/zsh")
+            if not os.path.exists(shell_program): shell_program = "/bin/bash"
+            shell_args = ["-c"]
+        else:
+            shell_program = os.environ.get("SHELL", "/bin/bash")
+            if not os.path.exists(shell_program): shell_program = "/bin/sh"
+            shell_args = ["-c"]
+        _SHELL_CACHE = (shell_program, shell_args)
+        logger.info(f"Determined shell: {shell_program} with args: {shell_args}")
+    return _SHELL_CACHE
+
 class LLMChatWidget(QWidget):
     command_submitted = pyqtSignal(str)
     execute_commands_requested = pyqtSignal(list)
@@ -23,8 +53,9 @@ class LLMChatWidget(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
 
-        self.history_view = QTextEdit()
+        self.history_view = QPlainTextEdit()
         self.history_view.setReadOnly(True)
+        self.history_view.setMaximumBlockCount(5000) # Old blocks are discarded instead of re-laid out
         self.history_view.setStyleSheet("font-family: Monospace; font-size: 10pt;")
         layout.addWidget(self.history_view, 1)
 
@@ -39,14 +70,14 @@ class LLMChatWidget(QWidget):
         command_input_layout.addWidget(self.input_line)
 
         self.send_button = QPushButton("Send")
-        self.send_button.setIcon(QIcon.fromTheme("mail-send", QIcon()))
+        self.send_button.setIcon(themed_icon("mail-send"))
         self.send_button.clicked.connect(self._send_command)
         self.send_button.setToolTip("Send command to LLM")
         command_input_layout.addWidget(self.send_button)
         input_area_layout.addLayout(command_input_layout)
 
         self.execute_suggestions_button = QPushButton("Execute Suggested Command(s)")
-        self.execute_suggestions_button.setIcon(QIcon.fromTheme("system-run", QIcon()))
+        self.execute_suggestions_button.setIcon(themed_icon("system-run"))
         self.execute_suggestions_button.clicked.connect(self._execute_suggestions)
         self.execute_suggestions_button.setEnabled(False)
         self.execute_suggestions_button.setToolTip("Run all commands prefixed with 'SHELL_COMMAND:' from the last LLM response")
@@ -67,49 +98,51 @@ class LLMChatWidget(QWidget):
 
     def add_message_to_history(self, sender: str, message: str):
         if sender == "User":
-            escaped_message = message.replace("&", "&").replace("<", "<").replace(">", ">")
+            escaped_message = html.escape(message, quote=False)
         else:
             escaped_message = message
 
-        formatted_message = escaped_message.replace("\n", "<br>")
+        # One block per line so the view's block cap and per-block layout apply to long replies
+        first_line, *other_lines = escaped_message.split("\n")
 
+        msg_upper = message.upper()
+        sender_is_error = "ERROR" in sender.upper()
         sender_color = "blue" if sender == "User" else "darkgreen"
-        if "Error" in sender.upper() or "ERROR" in message.upper():
+        if sender_is_error or "ERROR" in msg_upper:
             sender_color = "red"
-        elif "WARN" in message.upper():
+        elif "WARN" in msg_upper:
              sender_color = "orange"
 
-        self.history_view.append(f"<b style='color:{sender_color};'>{sender}:</b> {formatted_message}")
+        self.history_view.appendHtml(f"<b style='color:{sender_color};'>{sender}:</b> {first_line}")
+        if other_lines:
+            # Remaining lines go in under one edit block: a single relayout instead of one per appendHtml
+            cursor = QTextCursor(self.history_view.document())
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.beginEditBlock()
+            for line in other_lines:
+                cursor.insertBlock()
+                cursor.insertHtml(line)
+            cursor.endEditBlock()
         self.history_view.ensureCursorVisible()
-        QApplication.processEvents()
 
         if sender == "LLM":
-            self.suggested_commands_list = []
-            shell_command_prefix = "SHELL_COMMAND:"
-            raw_lines = message.split('\n')
-
-            for line in raw_lines:
-                stripped_line = line.strip()
-                if stripped_line.startswith(shell_command_prefix):
-                    command_part = stripped_line[len(shell_command_prefix):].strip()
-                    if "#" in command_part:
-                        command_part = command_part.split("#", 1)[0].strip()
-                    if command_part:
-                        self.suggested_commands_list.append(command_part)
+            # Everything after "SHELL_COMMAND:" up to an inline '#' comment, one match per line
+            self.suggested_commands_list = [cmd for m in _SHELL_CMD_RE.finditer(message)
+                                            if (cmd := m.group(1).strip())]
 
             if self.suggested_commands_list:
                 self.execute_suggestions_button.setEnabled(True)
                 if len(self.suggested_commands_list) > 1:
-                    self.history_view.append(f"<i>👆 {len(self.suggested_commands_list)} commands suggested. Click button to execute all sequentially or copy to terminal.</i>")
+                    self.history_view.appendHtml(f"<i>👆 {len(self.suggested_commands_list)} commands suggested. Click button to execute them in order or copy to terminal.</i>")
                 else:
-                    self.history_view.append(f"<i>👆 1 command suggested: '{self.suggested_commands_list[0]}'. Click button to execute or copy to terminal.</i>")
+                    self.history_view.appendHtml(f"<i>👆 1 command suggested: '{self.suggested_commands_list[0]}'. Click button to execute or copy to terminal.</i>")
                 logger.info(f"LLM suggested {len(self.suggested_commands_list)} command(s): {self.suggested_commands_list}")
 
     def set_processing_state(self, is_processing: bool):
         self.input_line.setEnabled(not is_processing)
         self.send_button.setEnabled(not is_processing)
         if is_processing:
-            self.history_view.append("<i style='color:gray;'>LLM is thinking...</i>")
+            self.history_view.appendHtml("<i style='color:gray;'>LLM is thinking...</i>")
             self.history_view.ensureCursorVisible()
 
         self.execute_suggestions_button.setEnabled(
@@ -123,7 +156,10 @@ class LLMChatWidget(QWidget):
             num_commands = len(self.suggested_commands_list)
             confirm_title = f"Confirm Execution of {num_commands} Command{'s' if num_commands > 1 else ''}"
             confirm_text = (f"Execute the following {num_commands} command{'s' if num_commands > 1 else ''} "
-                            f"sequentially in the terminal?\n\n{commands_display_list}")
+                            f"in order in the terminal?\n\n{commands_display_list}")
+            # Mirrors TerminalWidget.run_command_externally: cd-free lists run as one '&&' shell batch
+            if num_commands > 1 and not any(TerminalWidget._is_cd_command(cmd) for cmd in self.suggested_commands_list):
+                confirm_text += "\n\nExecution stops at the first command that fails."
 
             reply = QMessageBox.question(self, confirm_title, confirm_text,
                                          QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
@@ -140,19 +176,19 @@ class LLMChatWidget(QWidget):
 class TerminalWidget(QWidget):
     internal_directory_changed = pyqtSignal(str) # Emitted when 'cd' is successful
 
+    MAX_LINE_LENGTH = 4096 # Longer output lines are cropped to keep text layout cheap
+    OUTPUT_FLUSH_INTERVAL_MS = 30 # Pipe reads within this window are appended in one go
+
     def __init__(self, parent=None):
         super().__init__(parent)
         logger.debug("TerminalWidget initialized.")
         layout = QVBoxLayout(self)
-        self.output_view = QTextEdit()
+        self.output_view = QPlainTextEdit()
         self.output_view.setReadOnly(True)
+        self.output_view.setMaximumBlockCount(5000) # Old blocks are discarded instead of re-laid out
         self.output_view.setPlaceholderText("Terminal output will appear here. Enter commands below.")
-
-        palette = self.output_view.palette()
-        palette.setColor(QPalette.ColorRole.Base, QColor(43, 43, 43))
-        palette.setColor(QPalette.ColorRole.Text, QColor(248, 248, 242))
-        self.output_view.setPalette(palette)
-        self.output_view.setStyleSheet("font-family: Monospace; font-size: 10pt; border: 1px solid #555;")
+        self.output_view.setStyleSheet("font-family: Monospace; font-size: 10pt; border: 1px solid #555; "
+                                       "background-color: #2b2b2b; color: #f8f8f2;")
 
         layout.addWidget(self.output_view, 1)
 
@@ -168,27 +204,33 @@ class TerminalWidget(QWidget):
         self.command_queue: list[str] = []
         self.current_command_executing: bool = False
 
+        # Pipe output is buffered and flushed to the view on a short timer (see _flush_output)
+        self._stdout_buf = bytearray()
+        self._stderr_buf = bytearray()
+        self._flush_pending: bool = False
+        self._stdout_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._stderr_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+        # Character formats are built once and reused for every chunk, no HTML parsing per write
+        self._fmt_out = QTextCharFormat()
+        self._fmt_err = QTextCharFormat()
+        self._fmt_err.setForeground(QColor("red"))
+
         self.shell_program: str = ""
         self.shell_args_for_command: list[str] = []
 
         self._determine_shell()
+        # User and host never change during a session, resolve them once for the prompt
+        self._user: str = os.getenv("USER", "user")
+        self._hostname: str = platform.node().split('.')[0]
+        self._last_prompt_dir: str | None = None
         self.current_terminal_dir: str = QDir.homePath()
         self._update_prompt()
 
     def _determine_shell(self):
-        system = platform.system()
-        if system == "Windows":
-            self.shell_program = "cmd.exe"
-            self.shell_args_for_command = ["/c"]
-        elif system == "Darwin":
-            self.shell_program = os.environ.get("SHELL", "/bin/zsh")
-            if not os.path.exists(self.shell_program): self.shell_program = "/bin/bash"
-            self.shell_args_for_command = ["-c"]
-        else:
-            self.shell_program = os.environ.get("SHELL", "/bin/bash")
-            if not os.path.exists(self.shell_program): self.shell_program = "/bin/sh"
-            self.shell_args_for_command = ["-c"]
-        logger.info(f"Determined shell: {self.shell_program} with args: {self.shell_args_for_command}")
+        shell_program, shell_args = _get_shell()
+        self.shell_program = shell_program
+        self.shell_args_for_command = list(shell_args)
 
     def _init_process(self):
         if self.process and self.process.state() != QProcess.ProcessState.NotRunning:
@@ -203,13 +245,18 @@ class TerminalWidget(QWidget):
         self.process.readyReadStandardError.connect(self.handle_stderr)
         self.process.finished.connect(self.process_finished)
         self.process.errorOccurred.connect(self.process_error_occurred)
+        self.process.started.connect(self._on_process_started)
         logger.debug("QProcess initialized/re-initialized.")
 
+    def _on_process_started(self):
+        logger.debug(f"Process started (PID {self.process.processId() if self.process else 'N/A'}).")
+
     def _update_prompt(self):
+        if self.current_terminal_dir == self._last_prompt_dir:
+            return
+        self._last_prompt_dir = self.current_terminal_dir
         prompt_dir = os.path.basename(self.current_terminal_dir) if self.current_terminal_dir else "~"
-        user = os.getenv("USER", "user")
-        hostname = platform.node().split('.')[0]
-        self.command_input.setPlaceholderText(f"{user}@{hostname}:{prompt_dir}$ ")
+        self.command_input.setPlaceholderText(f"{self._user}@{self._hostname}:{prompt_dir}$ ")
 
     def set_current_directory(self, path: str): # Called by external sync (MainWindow/Navigation)
         q_dir = QDir(path)
@@ -218,23 +265,21 @@ class TerminalWidget(QWidget):
             if self.current_terminal_dir != new_cleaned_path:
                 self.current_terminal_dir = new_cleaned_path
                 self._update_prompt()
-                self.output_view.append(f"<i style='color:gray;'>Terminal directory externally set to: {self.current_terminal_dir}</i>")
-                self.output_view.ensureCursorVisible()
+                self.output_view.appendHtml(f"<i style='color:gray;'>Terminal directory externally set to: {self.current_terminal_dir}</i>")
                 logger.info(f"Terminal CWD (externally) set to: {self.current_terminal_dir}")
         else:
             logger.warning(f"Failed to set terminal CWD to non-existent/unreadable path: {path}")
-            self.output_view.append(f"<i style='color:red;'>Error: Cannot change directory to '{path}'</i>")
+            self.output_view.appendHtml(f"<i style='color:red;'>Error: Cannot change directory to '{path}'</i>")
 
     def run_command_from_input(self):
         command = self.command_input.text().strip()
         self.command_input.clear()
         if command:
             if self.current_command_executing:
-                self.output_view.append("<i style='color:orange;'>Previous command still running. Please wait.</i>")
+                self.output_view.appendHtml("<i style='color:orange;'>Previous command still running. Please wait.</i>")
                 logger.warning("User tried to run command while terminal was busy.")
                 return
-            self.output_view.append(f"<b style='color:lightgreen;'>{self.command_input.placeholderText()}</b>{command}")
-            self.output_view.ensureCursorVisible()
+            self.output_view.appendHtml(f"<b style='color:lightgreen;'>{self.command_input.placeholderText()}</b>{command}")
             self.current_command_executing = True
             self.execute_command_internal(command)
 
@@ -243,22 +288,44 @@ class TerminalWidget(QWidget):
         if isinstance(command_or_list, str):
             commands_to_run = [command_or_list]
             logger.info(f"Executing single command externally: {command_or_list}")
-            self.output_view.append(f"<b style='color:lightblue;'>Executing (from LLM):</b> {command_or_list}")
+            self.output_view.appendHtml(f"<b style='color:lightblue;'>Executing (from LLM):</b> {command_or_list}")
         elif isinstance(command_or_list, list):
             commands_to_run = command_or_list
             logger.info(f"Queueing {len(commands_to_run)} commands for external execution: {commands_to_run}")
-            self.output_view.append(f"<b style='color:lightblue;'>Executing {len(commands_to_run)} commands (from LLM):</b>")
-            for i, cmd_str in enumerate(commands_to_run):
-                 self.output_view.append(f"  <i>{i+1}. {cmd_str}</i>")
+            command_lines = "<br>".join(f"  <i>{i+1}. {cmd_str}</i>" for i, cmd_str in enumerate(commands_to_run))
+            self.output_view.appendHtml(f"<b style='color:lightblue;'>Executing {len(commands_to_run)} commands (from LLM):</b><br>{command_lines}")
         else:
             logger.error(f"run_command_externally received invalid type: {type(command_or_list)}")
             return
 
-        self.output_view.ensureCursorVisible()
+        if len(commands_to_run) > 1 and not any(self._is_cd_command(cmd) for cmd in commands_to_run):
+            self._submit_queue_as_batch(commands_to_run)
+            return
         self.command_queue.extend(commands_to_run)
         if not self.current_command_executing:
             self._try_execute_next_queued_command()
 
+    @staticmethod
+    def _cd_target(command: str) -> str | None:
+        """The argument of a 'cd' command ("" for a bare 'cd'), or None if the command isn't 'cd'."""
+        parts = command.split(None, 1) # Any whitespace after the name, so 'cd\t/' counts too
+        if not parts or parts[0].lower() != "cd":
+            return None
+        return parts[1].strip() if len(parts) > 1 else ""
+
+    @classmethod
+    def _is_cd_command(cls, command: str) -> bool:
+        return cls._cd_target(command) is not None
+
+    def _submit_queue_as_batch(self, commands: list[str]):
+        """Runs several commands in one shell invocation, stopping at the first failure."""
+        # 'cd' batches keep the per-command path since 'cd' is handled in-process, not by the shell
+        combined_command = " && ".join(commands)
+        logger.info(f"Submitting {len(commands)} commands as one shell batch: {combined_command}")
+        self.command_queue.append(combined_command)
+        if not self.current_command_executing:
+            self._try_execute_next_queued_command()
+
     def _try_execute_next_queued_command(self):
         if self.current_command_executing or not self.command_queue:
             return
@@ -268,31 +335,31 @@ class TerminalWidget(QWidget):
 
         # Only echo if it's a queued command and not the very first one from a direct external call (which already echoed)
         # This logic is a bit tricky, maybe simplify: always echo what's being run from queue.
-        self.output_view.append(f"<b style='color:lightgreen;'>{self.command_input.placeholderText()}</b><i>(Queued)</i> {command_to_run}")
-        self.output_view.ensureCursorVisible()
+        self.output_view.appendHtml(f"<b style='color:lightgreen;'>{self.command_input.placeholderText()}</b><i>(Queued)</i> {command_to_run}")
         self.execute_command_internal(command_to_run)
 
     def execute_command_internal(self, command: str):
-        if command.lower().startswith("cd ") or command.lower() == "cd":
+        cd_target = self._cd_target(command) # Parsed once; None for anything but 'cd'
+        if cd_target is not None:
             try:
-                target_dir_part = QDir.homePath() if command.lower() == "cd" else command[3:].strip().replace("~", QDir.homePath())
-                new_dir_abs = os.path.abspath(os.path.join(self.current_terminal_dir, target_dir_part) if not os.path.isabs(target_dir_part) else target_dir_part)
+                target_dir_part = os.path.expanduser(cd_target) if cd_target else QDir.homePath()
+                # join() keeps an absolute target as-is; abspath normalizes lexically, symlinks are left unresolved
+                new_dir_abs = os.path.abspath(os.path.join(self.current_terminal_dir, target_dir_part))
 
-                q_new_dir = QDir(new_dir_abs)
-                if q_new_dir.exists() and q_new_dir.isReadable():
+                if os.path.isdir(new_dir_abs) and os.access(new_dir_abs, os.R_OK):
                     old_dir = self.current_terminal_dir
                     self.current_terminal_dir = QDir.cleanPath(new_dir_abs)
                     self._update_prompt()
-                    self.output_view.append(f"<i style='color:gray;'>Terminal directory changed to: {self.current_terminal_dir}</i>")
+                    self.output_view.appendHtml(f"<i style='color:gray;'>Terminal directory changed to: {self.current_terminal_dir}</i>")
                     if old_dir != self.current_terminal_dir:
                         self.internal_directory_changed.emit(self.current_terminal_dir) # <--- EMIT
                         logger.info(f"Internal 'cd' successful. New path '{self.current_terminal_dir}' emitted for GUI sync.")
                 else:
-                    self.output_view.append(f"<i style='color:red;'>cd: no such file or directory: {target_dir_part} (resolved to {new_dir_abs})</i>")
+                    self.output_view.appendHtml(f"<i style='color:red;'>cd: no such file or directory: {target_dir_part} (resolved to {new_dir_abs})</i>")
                     logger.warning(f"'cd' target invalid: {target_dir_part} (resolved to {new_dir_abs})")
             except Exception as e:
                 logger.error(f"Error processing 'cd' command '{command}': {e}", exc_info=True)
-                self.output_view.append(f"<i style='color:red;'>Error processing cd: {e}</i>")
+                self.output_view.appendHtml(f"<i style='color:red;'>Error processing cd: {e}</i>")
 
             self.current_command_executing = False
             self._try_execute_next_queued_command()
@@ -306,46 +373,90 @@ class TerminalWidget(QWidget):
             full_command_args = self.shell_args_for_command + [command]
             self.process.setArguments(full_command_args)
             logger.debug(f"Starting process: {self.shell_program} with args {full_command_args} in CWD {self.current_terminal_dir}")
+            # Non-blocking: start failures arrive via errorOccurred (process_error_occurred)
             self.process.start()
-            if not self.process.waitForStarted(3000):
-                err_str = self.process.errorString() if self.process else "Process object is None"
-                logger.error(f"Process failed to start: {err_str}")
-                self.output_view.append(f"<i style='color:red;'>Error starting process: {err_str}</i>")
-                self.current_command_executing = False
-                self._try_execute_next_queued_command()
         else:
             msg = "<i>Error: Terminal is busy or QProcess not ready. Command not started.</i>"
-            self.output_view.append(msg)
+            self.output_view.appendHtml(msg)
             logger.error(f"{msg} Current process state: {self.process.state() if self.process else 'None'}")
             self.current_command_executing = False
             self._try_execute_next_queued_command()
 
+    def _crop_long_lines(self, text: str, line_start_len: int = 0) -> str:
+        """Crops each line to MAX_LINE_LENGTH. line_start_len is the length of the document's last line,
+        which text's first line continues, so a line streamed over several flushes is cropped once."""
+        if line_start_len + len(text) <= self.MAX_LINE_LENGTH:
+            return text
+        lines = text.split('\n')
+        for i, line in enumerate(lines):
+            room = self.MAX_LINE_LENGTH - (line_start_len if i == 0 else 0)
+            if len(line) > room:
+                # Negative room: the line already carries the marker, so the rest of it is dropped
+                lines[i] = line[:room] + "...[truncated]" if room >= 0 else ""
+        return '\n'.join(lines)
+
     def handle_stdout(self):
         if not self.process: return
         data = self.process.readAllStandardOutput()
-        text = bytes(data).decode(errors='replace')
-        self.output_view.insertPlainText(text)
-        self.output_view.ensureCursorVisible()
+        if data.isEmpty(): return
+        self._stdout_buf += bytes(data)
+        self._schedule_flush()
 
     def handle_stderr(self):
         if not self.process: return
         data = self.process.readAllStandardError()
-        text = bytes(data).decode(errors='replace').strip()
-        if text:
-            self.output_view.append(f"<pre style='color:red; margin:0; padding:0;'>{text}</pre>")
-            self.output_view.ensureCursorVisible()
+        if data.isEmpty(): return
+        self._stderr_buf += bytes(data)
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        if not self._flush_pending:
+            self._flush_pending = True
+            QTimer.singleShot(self.OUTPUT_FLUSH_INTERVAL_MS, self._flush_output)
+
+    def _flush_output(self, final: bool = False):
+        self._flush_pending = False
+        if not final and not self._stdout_buf and not self._stderr_buf:
+            return
+        # Incremental decoders keep a multibyte sequence split across reads until its tail arrives
+        out_text = self._stdout_decoder.decode(self._stdout_buf, final=final)
+        err_text = self._stderr_decoder.decode(self._stderr_buf, final=final)
+        self._stdout_buf.clear()
+        self._stderr_buf.clear()
+        if final:
+            self._stdout_decoder.reset()
+            self._stderr_decoder.reset()
+        # isspace() stops at the first visible char, unlike strip() which copies the whole chunk
+        if err_text.isspace():
+            err_text = ""
+        if not out_text and not err_text:
+            return
+        # Follow new output only if the view is already at the bottom; don't yank a user who scrolled up
+        scrollbar = self.output_view.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+        cursor = QTextCursor(self.output_view.document()) # Separate from the view's cursor, keeps any selection
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if out_text:
+            cursor.insertText(self._crop_long_lines(out_text, cursor.positionInBlock()), self._fmt_out)
+        if err_text:
+            if not cursor.atBlockStart():
+                cursor.insertBlock()
+            cursor.insertText(self._crop_long_lines(err_text, cursor.positionInBlock()), self._fmt_err)
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
 
     def process_finished(self, exitCode: int, exitStatus: QProcess.ExitStatus):
+        self._flush_output(final=True) # Emit any buffered output before the status line
         status_str = "normally" if exitStatus == QProcess.ExitStatus.NormalExit else "with a crash"
         log_msg = f"Process finished {status_str} with exit code {exitCode}."
         logger.info(log_msg)
-        self.output_view.append(f"<i style='color:gray;'>{log_msg}</i>")
+        self.output_view.appendHtml(f"<i style='color:gray;'>{log_msg}</i>")
         self._update_prompt()
-        self.output_view.ensureCursorVisible()
         self.current_command_executing = False
         self._try_execute_next_queued_command()
 
     def process_error_occurred(self, error: QProcess.ProcessError):
+        self._flush_output(final=True)
         error_map = {
             QProcess.ProcessError.FailedToStart: "Failed to Start", QProcess.ProcessError.Crashed: "Crashed",
             QProcess.ProcessError.Timedout: "Timed Out", QProcess.ProcessError.ReadError: "Read Error",
@@ -355,45 +466,101 @@ class TerminalWidget(QWidget):
         process_error_detail = self.process.errorString() if self.process else "QProcess object is None"
         log_msg = f"QProcess Error: {error_str}. Details: {process_error_detail}"
         logger.error(log_msg)
-        self.output_view.append(f"<i style='color:red;'>{log_msg}</i>")
+        self.output_view.appendHtml(f"<i style='color:red;'>{log_msg}</i>")
         self._update_prompt()
-        self.output_view.ensureCursorVisible()
         self.current_command_executing = False
         self._try_execute_next_queued_command()
 
 
 class LLMTerminalPane(QTabWidget):
     external_path_change_request = pyqtSignal(str)
+    terminal_widget_created = pyqtSignal(object) # Emitted once, when the Terminal tab is first built
+
+    CHAT_TAB_INDEX = 0
+    TERMINAL_TAB_INDEX = 1
+    # index -> (icon theme name, tab text, tooltip)
+    _TAB_SPECS = {
+        CHAT_TAB_INDEX: ("chat-message-new", "LLM Chat", "Chat with the LLM for file operations and suggestions."),
+        TERMINAL_TAB_INDEX: ("utilities-terminal", "Terminal", "Execute shell commands directly."),
+    }
 
     def __init__(self, parent=None):
         super().__init__(parent)
         logger.debug("LLMTerminalPane initialized.")
-        self.llm_service = LLMService() # Pane holds the LLM service instance
-
-        self.llm_chat_widget = LLMChatWidget()
-        self.addTab(self.llm_chat_widget, QIcon.fromTheme("chat-message-new", QIcon()), "LLM Chat")
-
-        self.terminal_widget = TerminalWidget()
-        self.addTab(self.terminal_widget, QIcon.fromTheme("utilities-terminal", QIcon()), "Terminal")
-
-        self.external_path_change_request.connect(self.terminal_widget.set_current_directory)
+        # The LLM service and tab widgets are built on first use (see get_llm_service / _ensure_tab_widget)
+        self._llm_service: "LLMService | None" = None
+        self.llm_chat_widget: LLMChatWidget | None = None
+        self.terminal_widget: TerminalWidget | None = None
+        self._pending_terminal_dir: str | None = None # Last external path, applied when the terminal is built
+
+        for index in sorted(self._TAB_SPECS):
+            icon_name, text, tooltip = self._TAB_SPECS[index]
+            self.addTab(QWidget(), themed_icon(icon_name), text) # Placeholder
+            self.setTabToolTip(index, tooltip)
+
+        self.external_path_change_request.connect(self._on_external_path_change)
         self.currentChanged.connect(self._on_tab_changed)
-        self.setTabToolTip(0, "Chat with the LLM for file operations and suggestions.")
-        self.setTabToolTip(1, "Execute shell commands directly.")
+        self._ensure_tab_widget(self.currentIndex())
+
+    def _ensure_tab_widget(self, index: int):
+        if index == self.CHAT_TAB_INDEX and self.llm_chat_widget is None:
+            self.llm_chat_widget = LLMChatWidget()
+            self._replace_placeholder(index, self.llm_chat_widget)
+            logger.debug("LLMChatWidget created on first use.")
+        elif index == self.TERMINAL_TAB_INDEX and self.terminal_widget is None:
+            self.terminal_widget = TerminalWidget()
+            if self._pending_terminal_dir:
+                self.terminal_widget.set_current_directory(self._pending_terminal_dir)
+            self._replace_placeholder(index, self.terminal_widget)
+            logger.debug("TerminalWidget created on first use.")
+            self.terminal_widget_created.emit(self.terminal_widget)
+
+    def _replace_placeholder(self, index: int, widget: QWidget):
+        icon_name, text, tooltip = self._TAB_SPECS[index]
+        current_index = self.currentIndex()
+        self.blockSignals(True) # Swapping tabs must not re-enter _on_tab_changed
+        try:
+            placeholder = self.widget(index)
+            self.removeTab(index)
+            if placeholder is not None:
+                placeholder.deleteLater()
+            self.insertTab(index, widget, themed_icon(icon_name), text)
+            self.setTabToolTip(index, tooltip)
+            self.setCurrentIndex(current_index)
+        finally:
+            self.blockSignals(False)
+
+    def _on_external_path_change(self, path: str):
+        self._pending_terminal_dir = path
+        if self.terminal_widget:
+            self.terminal_widget.set_current_directory(path)
 
     def _on_tab_changed(self, index: int):
+        self._ensure_tab_widget(index)
         current_widget = self.widget(index)
         logger.debug(f"Tab changed to: {self.tabText(index)}")
-        if current_widget == self.terminal_widget:
+        if current_widget is not None and current_widget == self.terminal_widget:
             self.terminal_widget.command_input.setFocus(Qt.FocusReason.TabFocusReason)
-        elif current_widget == self.llm_chat_widget:
+        elif current_widget is not None and current_widget == self.llm_chat_widget:
              self.llm_chat_widget.input_line.setFocus(Qt.FocusReason.TabFocusReason)
 
-    def get_llm_chat_widget(self) -> LLMChatWidget:
+    def run_commands_in_terminal(self, commands: list[str]):
+        terminal_widget = self.get_terminal_widget()
+        if terminal_widget:
+            terminal_widget.run_command_externally(commands)
+
+    def get_llm_chat_widget(self, create: bool = True) -> LLMChatWidget | None:
+        if create:
+            self._ensure_tab_widget(self.CHAT_TAB_INDEX)
         return self.llm_chat_widget
 
-    def get_terminal_widget(self) -> TerminalWidget:
+    def get_terminal_widget(self, create: bool = True) -> TerminalWidget | None:
+        if create:
+            self._ensure_tab_widget(self.TERMINAL_TAB_INDEX)
         return self.terminal_widget
 
-    def get_llm_service(self) -> LLMService: # Allow MainWindow to access this instance
-        return self.llm_service
+    def get_llm_service(self) -> "LLMService": # Allow MainWindow to access this instance
+        if self._llm_service is None:
+            from ..core.llm_service import LLMService # Deferred: pulls in requests and probes Ollama
+            self._llm_service = LLMService()
+        return self._llm_service
@@ -1,11 +1,28 @@
 import os
+import bisect
 import logging
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QListWidget, QListWidgetItem
-from PyQt6.QtCore import pyqtSignal, QDir, Qt, QStandardPaths, QSize # QStandardPaths is correct
-from PyQt6.QtGui import QIcon
+from PyQt6.QtCore import (pyqtSignal, QDir, Qt, QStandardPaths, QSize, # QStandardPaths is correct
+                          QObject, QRunnable, QThreadPool)
+
+from .icon_provider import themed_icon
 
 logger = logging.getLogger("automgr.ui.navigation_pane")
 
+class _ShortcutCheckSignals(QObject):
+    checked = pyqtSignal(int, bool) # (shortcut order, path is a usable directory)
+
+class _ShortcutCheckTask(QRunnable):
+    """Stats one shortcut path on a pool thread so slow mounts don't block the UI."""
+    def __init__(self, order: int, path: str, signals: _ShortcutCheckSignals):
+        super().__init__()
+        self.order = order
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        self.signals.checked.emit(self.order, os.path.isdir(self.path))
+
 class NavigationPane(QWidget):
     path_selected = pyqtSignal(str)
 
@@ -19,6 +36,11 @@ class NavigationPane(QWidget):
         self.shortcut_list.setIconSize(QSize(24,24)) # For icons
         layout.addWidget(self.shortcut_list)
 
+        self._shortcuts: list[tuple[str, str, str]] = []
+        self._added_shortcut_orders: list[int] = [] # Sorted; keeps list rows in declaration order
+        self._check_signals = _ShortcutCheckSignals(self)
+        self._check_signals.checked.connect(self._on_shortcut_checked)
+
         self._populate_shortcuts()
         self.shortcut_list.itemClicked.connect(self._on_item_clicked)
 
@@ -37,21 +59,38 @@ class NavigationPane(QWidget):
             # ("Desktop", QStandardPaths.writableLocation(QStandardPaths.StandardLocation.DesktopLocation), "user-desktop"),
         ]
 
-        for name, path, icon_name in shortcuts:
+        self._shortcuts = shortcuts
+        pool = QThreadPool.globalInstance()
+        for order, (name, path, icon_name) in enumerate(shortcuts):
             # Ensure path is not None or empty (QStandardPaths can return empty string if location doesn't exist/isn't set up)
-            if path and ( (os.path.exists(path) and os.path.isdir(path)) or name == "Computer" ):
-                item = QListWidgetItem(name)
-                # Try to get themed icon
-                icon = QIcon.fromTheme(icon_name) 
-                # If you have custom icons in an assets folder and a Qt resource file:
-                # if icon.isNull(): 
-                #    icon = QIcon(f":/assets/icons/{icon_name.replace('-', '_')}.png") # Example resource path
-                item.setIcon(icon)
-                item.setData(Qt.ItemDataRole.UserRole, path) # Store the actual path in the item's data
-                self.shortcut_list.addItem(item)
-                logger.debug(f"Added shortcut: {name} -> {path}")
+            if name == "Computer":
+                self._add_shortcut_item(order)
+            elif path:
+                pool.start(_ShortcutCheckTask(order, path, self._check_signals))
             else:
-                logger.warning(f"Shortcut path '{path}' for '{name}' is invalid, non-existent, or not a directory. Skipping.")
+                logger.warning(f"Shortcut path for '{name}' is not set up. Skipping.")
+
+    def _on_shortcut_checked(self, order: int, is_valid_dir: bool):
+        if is_valid_dir:
+            self._add_shortcut_item(order)
+        else:
+            name, path, _ = self._shortcuts[order]
+            logger.warning(f"Shortcut path '{path}' for '{name}' is invalid, non-existent, or not a directory. Skipping.")
+
+    def _add_shortcut_item(self, order: int):
+        name, path, icon_name = self._shortcuts[order]
+        item = QListWidgetItem(name)
+        # Try to get themed icon
+        icon = themed_icon(icon_name)
+        # If you have custom icons in an assets folder and a Qt resource file:
+        # if icon.isNull():
+        #    icon = QIcon(f":/assets/icons/{icon_name.replace('-', '_')}.png") # Example resource path
+        item.setIcon(icon)
+        item.setData(Qt.ItemDataRole.UserRole, path) # Store the actual path in the item's data
+        row = bisect.bisect_left(self._added_shortcut_orders, order)
+        self._added_shortcut_orders.insert(row, order)
+        self.shortcut_list.insertItem(row, item)
+        logger.debug(f"Added shortcut: {name} -> {path}")
 
 
     def _on_item_clicked(self, item: QListWidgetItem):
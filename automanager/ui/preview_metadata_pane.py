@@ -1,24 +1,172 @@
 import os
+import stat
+import time
 import logging
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit, QScrollArea,
+import functools
+import importlib
+from contextlib import contextmanager
+import threading
+from typing import NamedTuple
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit, QPlainTextEdit, QScrollArea,
                              QStackedWidget, QGroupBox, QFormLayout, QLineEdit,
                              QApplication, QSizePolicy, QFrame, QSplitter) # Added QSplitter, QHBoxLayout
-from PyQt6.QtCore import Qt, QFileInfo, pyqtSignal, QTimer, QUrl, QMimeDatabase
-from PyQt6.QtGui import QIcon, QCloseEvent # Added QCloseEvent
-
-# Import your custom preview widgets
-from ..previews.image_preview_widget import ImagePreviewWidget
-from ..previews.text_preview_widget import TextPreviewWidget
-from ..previews.pdf_preview_widget import PdfPreviewWidget
-from ..previews.video_preview_widget import VideoPreviewWidget
-from ..previews.docx_preview_widget import DocxPreviewWidget
-from ..previews.doc_preview_widget import DocPreviewWidget
-# TODO: from ..previews.archive_preview_widget import ArchivePreviewWidget
+from PyQt6.QtCore import (Qt, QFileInfo, pyqtSignal, QTimer, QUrl, QMimeDatabase, QMimeType, QDateTime,
+                          QObject, QRunnable, QThreadPool)
+from PyQt6.QtGui import QIcon, QCloseEvent, QShowEvent, QTextOption
+
+# Preview widgets are imported and built on first use (see _ensure_widget); the PDF and video
+# ones pull in PyMuPDF and QtMultimedia, which most sessions never need.
+# attribute name -> (module under automanager.previews, class name)
+_PREVIEW_WIDGET_CLASSES: dict[str, tuple[str, str]] = {
+    'image_preview_widget': ('image_preview_widget', 'ImagePreviewWidget'),
+    'text_preview_widget': ('text_preview_widget', 'TextPreviewWidget'),
+    'pdf_preview_widget': ('pdf_preview_widget', 'PdfPreviewWidget'),
+    'video_preview_widget': ('video_preview_widget', 'VideoPreviewWidget'),
+    'docx_preview_widget': ('docx_preview_widget', 'DocxPreviewWidget'),
+    'doc_preview_widget': ('doc_preview_widget', 'DocPreviewWidget'),
+}
 
 logger = logging.getLogger("automgr.ui.preview_metadata")
 
+# One shared MIME database; constructing it per selection re-reads the shared mime cache
+_MIME_DB = QMimeDatabase()
+
+_EXT_IMAGE = frozenset({'png', 'jpg', 'jpeg', 'gif', 'bmp', 'svg', 'webp', 'tiff', 'ico'})
+_EXT_VIDEO = frozenset({'mp4', 'avi', 'mkv', 'mov', 'wmv', 'flv', 'webm', 'mpeg', 'mpg', 'ogv', '3gp'})
+_EXT_TEXT = frozenset({'py', 'js', 'json', 'md', 'log', 'ini', 'xml', 'html', 'css', 'csv', 'sh',
+                       'bat', 'conf', 'yaml', 'yml', 'c', 'cpp', 'h', 'java', 'cs', 'rb', 'php', 'go',
+                       'rs', 'swift', 'kt', 'kts', 'gradle'})
+
+_IMAGE_PREVIEW = ('image_preview_widget', 'load_image')
+_VIDEO_PREVIEW = ('video_preview_widget', 'load_video')
+_TEXT_PREVIEW = ('text_preview_widget', 'load_text')
+
+# extension -> (preview widget attribute, load method name)
+_EXT_DISPATCH: dict[str, tuple[str, str]] = {
+    **dict.fromkeys(_EXT_IMAGE, _IMAGE_PREVIEW),
+    **dict.fromkeys(_EXT_VIDEO, _VIDEO_PREVIEW),
+    **dict.fromkeys(_EXT_TEXT, _TEXT_PREVIEW),
+    'pdf': ('pdf_preview_widget', 'load_pdf'),
+    'docx': ('docx_preview_widget', 'load_docx'),
+    'doc': ('doc_preview_widget', 'load_doc'),
+}
+# Fallback for extensions not in the table: MIME top-level type ("text" of "text/plain") -> preview
+_MIME_TOP_DISPATCH: dict[str, tuple[str, str]] = {'text': _TEXT_PREVIEW, 'image': _IMAGE_PREVIEW, 'video': _VIDEO_PREVIEW}
+
+
+class _FileInfo(NamedTuple):
+    size: int
+    is_dir: bool
+    is_file: bool
+    suffix: str
+    mime: QMimeType
+    birth_time: QDateTime
+    modified: QDateTime
+
+
+def _file_info(path: str) -> _FileInfo | None:
+    """One stat() per call; MIME and birth-time lookups are reused until the file's mtime changes."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return _file_info_for(path, st.st_mtime_ns, st.st_size,
+                          stat.S_ISDIR(st.st_mode), stat.S_ISREG(st.st_mode),
+                          getattr(st, 'st_birthtime', None)) # Not provided by Linux stat()
+
+
+def _mime_for(path: str, is_dir: bool, is_file: bool) -> QMimeType:
+    if is_dir: # Extension matching knows nothing about directories and would say application/octet-stream
+        return _MIME_DB.mimeTypeForName("inode/directory")
+    if not is_file: # Sockets, FIFOs, devices: the default match maps them to their inode/* types
+        return _MIME_DB.mimeTypeForFile(path)
+    # Name/extension matching needs no file read; only sniff content when the name says nothing
+    mime = _MIME_DB.mimeTypeForFile(path, QMimeDatabase.MatchMode.MatchExtension)
+    if mime.isDefault():
+        mime = _MIME_DB.mimeTypeForFile(path, QMimeDatabase.MatchMode.MatchContent)
+    return mime
+
+
+@functools.lru_cache(maxsize=4096)
+def _file_info_for(path: str, mtime_ns: int, size: int, is_dir: bool, is_file: bool,
+                   birth_s: float | None) -> _FileInfo:
+    name = os.path.basename(path)
+    suffix = name.rpartition('.')[2] if '.' in name else "" # Same rule as QFileInfo.suffix()
+    if birth_s is not None:
+        birth_time = QDateTime.fromMSecsSinceEpoch(int(birth_s * 1000))
+    else:
+        birth_time = QFileInfo(path).birthTime() # statx() birth time where the filesystem has one
+    return _FileInfo(size=size, is_dir=is_dir, is_file=is_file, suffix=suffix,
+                     mime=_mime_for(path, is_dir, is_file),
+                     birth_time=birth_time,
+                     modified=QDateTime.fromMSecsSinceEpoch(mtime_ns // 1_000_000))
+
+_SIZE_UNITS = ('bytes', 'KB', 'MB', 'GB', 'TB')
+
+@contextmanager
+def _silent(*widgets: QWidget):
+    """Blocks the widgets' signals for programmatic edits, so they don't look like user input."""
+    for w in widgets:
+        w.blockSignals(True)
+    try:
+        yield
+    finally:
+        for w in widgets:
+            w.blockSignals(False)
+
+def _summarize_paths(paths: list[str]) -> tuple[int, int, int]:
+    """Returns (total file size, file count, folder count) with one stat() per selected path."""
+    total_size = file_count = folder_count = 0
+    for p in paths:
+        try:
+            st = os.stat(p)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
+            total_size += st.st_size
+            file_count += 1
+        elif stat.S_ISDIR(st.st_mode):
+            folder_count += 1
+    return total_size, file_count, folder_count
+
+class _MetadataSignals(QObject):
+    loaded = pyqtSignal(str, object) # (path, metadata dict or None)
+    saved = pyqtSignal(str)
+
+class _MetadataLoadTask(QRunnable):
+    def __init__(self, service, path: str, signals: _MetadataSignals):
+        super().__init__()
+        self.service = service
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        self.signals.loaded.emit(self.path, self.service.get_metadata(self.path))
+
+class _MetadataSaveTask(QRunnable):
+    """Drains every pending write when it runs and stores them in one transaction."""
+    def __init__(self, service, pending: dict[str, dict], lock: threading.Lock, signals: _MetadataSignals):
+        super().__init__()
+        self.service = service
+        self.pending = pending
+        self.lock = lock
+        self.signals = signals
+
+    def run(self):
+        with self.lock:
+            batch = dict(self.pending)
+            self.pending.clear()
+        if not batch:
+            return
+        self.service.save_many(batch)
+        for path in batch:
+            self.signals.saved.emit(path)
+
 class PreviewMetadataPane(QWidget):
     metadata_updated_for_file = pyqtSignal(str)
+    PREVIEW_DEBOUNCE_MS = 120
+    TAGS_PLACEHOLDER = "Comma-separated tags (e.g., work, important)"
+    NOTES_PLACEHOLDER = "Add custom notes here..."
 
     def __init__(self, metadata_service=None, parent=None):
         super().__init__(parent)
@@ -26,6 +174,24 @@ class PreviewMetadataPane(QWidget):
         self.current_file_path = None
         logger.debug("PreviewMetadataPane initialized.")
 
+        # Metadata DB reads/writes run off the GUI thread. A single worker keeps them in submission
+        # order, so a load always sees the saves queued before it.
+        self._metadata_pool = QThreadPool(self)
+        self._metadata_pool.setMaxThreadCount(1)
+        self._pending_writes: dict[str, dict] = {} # path -> save_metadata kwargs not yet written
+        self._pending_writes_lock = threading.Lock()
+        self._metadata_signals = _MetadataSignals(self)
+        self._metadata_signals.loaded.connect(self._on_metadata_loaded)
+        self._metadata_signals.saved.connect(self.metadata_updated_for_file)
+
+        # Selection changes are debounced so arrow-key scrolling only loads the preview it stops on
+        self._pending_preview_paths: list[str] = []
+        self._preview_debounce = QTimer(self)
+        self._preview_debounce.setSingleShot(True)
+        self._preview_debounce.setInterval(self.PREVIEW_DEBOUNCE_MS)
+        self._preview_debounce.timeout.connect(self._do_update_preview)
+        self._preview_stale = False # Selection changed while the pane was hidden; refreshed in showEvent
+
         # Main layout for this pane will now be a QHBoxLayout to hold the splitter
         outer_layout = QHBoxLayout(self) # Changed from QVBoxLayout
         self.setLayout(outer_layout)
@@ -46,20 +212,15 @@ class PreviewMetadataPane(QWidget):
         self.no_preview_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.no_preview_widget.setWordWrap(True)
 
-        self.image_preview_widget = ImagePreviewWidget()
-        self.text_preview_widget = TextPreviewWidget()
-        self.pdf_preview_widget = PdfPreviewWidget()
-        self.video_preview_widget = VideoPreviewWidget()
-        self.docx_preview_widget = DocxPreviewWidget()
-        self.doc_preview_widget = DocPreviewWidget()
+        self.image_preview_widget: QWidget | None = None
+        self.text_preview_widget: QWidget | None = None
+        self.pdf_preview_widget: QWidget | None = None
+        self.video_preview_widget: QWidget | None = None
+        self.docx_preview_widget: QWidget | None = None
+        self.doc_preview_widget: QWidget | None = None
 
         self.preview_stack.addWidget(self.no_preview_widget)
-        self.preview_stack.addWidget(self.image_preview_widget)
-        self.preview_stack.addWidget(self.text_preview_widget)
-        self.preview_stack.addWidget(self.pdf_preview_widget)
-        self.preview_stack.addWidget(self.video_preview_widget)
-        self.preview_stack.addWidget(self.docx_preview_widget)
-        self.preview_stack.addWidget(self.doc_preview_widget)
+        self._active_preview_widget: QWidget | None = None # Only this one holds loaded content
 
         preview_group_layout.addWidget(self.preview_stack)
         # self.preview_group will be added to the splitter
@@ -82,8 +243,10 @@ class PreviewMetadataPane(QWidget):
         self.lbl_name.setReadOnly(True)
         self.lbl_name.setFrame(False)
 
-        self.lbl_path = QTextEdit()
+        # Plain text: no HTML parse per selection, and a path containing '<' is shown as-is
+        self.lbl_path = QPlainTextEdit()
         self.lbl_path.setReadOnly(True)
+        self.lbl_path.setWordWrapMode(QTextOption.WrapMode.WrapAtWordBoundaryOrAnywhere) # Paths rarely have spaces
         self.lbl_path.setFrameShape(QFrame.Shape.NoFrame)
         self.lbl_path.setFixedHeight(45)
         self.lbl_path.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
@@ -93,6 +256,8 @@ class PreviewMetadataPane(QWidget):
         self.lbl_type = QLabel()
         self.lbl_created = QLabel()
         self.lbl_modified = QLabel()
+        for lbl in (self.lbl_size, self.lbl_type, self.lbl_created, self.lbl_modified):
+            lbl.setTextFormat(Qt.TextFormat.PlainText) # Skip the rich-text sniffing setText does by default
 
         self.metadata_form_layout.addRow("Name:", self.lbl_name)
         self.metadata_form_layout.addRow("Path:", self.lbl_path)
@@ -102,18 +267,21 @@ class PreviewMetadataPane(QWidget):
         self.metadata_form_layout.addRow("Modified:", self.lbl_modified)
 
         self.tags_edit = QLineEdit()
-        self.tags_edit.setPlaceholderText("Comma-separated tags (e.g., work, important)")
+        self.tags_edit.setPlaceholderText(self.TAGS_PLACEHOLDER)
         self.tags_edit.editingFinished.connect(self._save_current_tags)
         self.metadata_form_layout.addRow("Tags:", self.tags_edit)
 
         self.notes_edit = QTextEdit()
-        self.notes_edit.setPlaceholderText("Add custom notes here...")
+        self.notes_edit.setPlaceholderText(self.NOTES_PLACEHOLDER)
         self.notes_edit.setFixedHeight(100)
         self._notes_save_timer = QTimer(self)
         self._notes_save_timer.setSingleShot(True)
         self._notes_save_timer.setInterval(1500)
         self._notes_save_timer.timeout.connect(self._save_current_notes)
-        self.notes_edit.textChanged.connect(self._notes_save_timer.start)
+        self._notes_dirty = False # Edited since the last save was queued
+        self._last_saved_tags: tuple[str, ...] | None = None # As loaded/saved for current_file_path; None if unknown
+        self._notes_last_restart = 0.0
+        self.notes_edit.textChanged.connect(self._on_notes_changed)
         self.metadata_form_layout.addRow("Notes:", self.notes_edit)
 
         metadata_scroll_area.setWidget(metadata_widget_container)
@@ -124,11 +292,8 @@ class PreviewMetadataPane(QWidget):
         self.splitter.addWidget(self.preview_group)
         self.splitter.addWidget(self.metadata_group)
 
-        # Set initial sizes for the splitter panes (optional, adjusts proportionally)
-        # For a horizontal splitter, these are widths.
-        # Example: Make preview take 2/3 and metadata 1/3 of the available width initially
-        total_width = self.width() if self.width() > 0 else 800 # Estimate if not yet shown
-        self.splitter.setSizes([int(total_width * 0.6), int(total_width * 0.4)])
+        # Initial 60/40 split of the splitter widths is applied in showEvent, once the real width is known
+        self._initial_sizes_set = False
         # Or you can set fixed minimum sizes if preferred
         # self.preview_group.setMinimumWidth(300)
         # self.metadata_group.setMinimumWidth(200)
@@ -146,20 +311,39 @@ class PreviewMetadataPane(QWidget):
     def set_metadata_service(self, service):
         self.metadata_service = service
 
+    def _ensure_widget(self, attr: str) -> QWidget:
+        widget = getattr(self, attr)
+        if widget is None:
+            module_name, class_name = _PREVIEW_WIDGET_CLASSES[attr]
+            module = importlib.import_module(f"..previews.{module_name}", __package__)
+            widget = getattr(module, class_name)()
+            self.preview_stack.addWidget(widget)
+            setattr(self, attr, widget)
+            logger.debug(f"Created {class_name} on first use.")
+        return widget
+
     def _clear_all_previews(self):
-        logger.debug("Clearing all preview widgets before switching.")
-        for i in range(self.preview_stack.count()):
-            widget = self.preview_stack.widget(i)
-            if hasattr(widget, 'clear_preview'): 
-                try:
-                    widget.clear_preview()
-                except Exception as e:
-                    logger.error(f"Error calling clear_preview on {widget.__class__.__name__}: {e}", exc_info=True)
-            elif isinstance(widget, QLabel) and widget == self.no_preview_widget:
-                widget.setText("Select a file to preview.")
+        # Previews are only loaded into the widget being shown, so that is the only one to clear
+        widget = self._active_preview_widget
+        if widget is None:
+            return
+        self._active_preview_widget = None
+        logger.debug(f"Clearing {widget.__class__.__name__} before switching.")
+        try:
+            widget.clear_preview()
+        except Exception as e:
+            logger.error(f"Error calling clear_preview on {widget.__class__.__name__}: {e}", exc_info=True)
 
 
     def update_preview(self, selected_paths: list[str]):
+        self._pending_preview_paths = list(selected_paths)
+        if not self.isVisible(): # Dock closed: skip stat/decode/DB work nobody would see
+            self._preview_stale = True
+            return
+        self._preview_debounce.start() # Restarts the interval if a change is already pending
+
+    def _do_update_preview(self):
+        selected_paths = self._pending_preview_paths
         logger.debug(f"Update preview/metadata requested for {len(selected_paths)} paths. First: {selected_paths[0] if selected_paths else 'None'}")
 
         new_selected_file = selected_paths[0] if selected_paths else None
@@ -172,11 +356,13 @@ class PreviewMetadataPane(QWidget):
 
         if not selected_paths: 
             self.current_file_path = None
+            self.no_preview_widget.setText("Select a file to preview.")
             self.preview_stack.setCurrentWidget(self.no_preview_widget)
             self._clear_metadata_display_fields() 
-            self.notes_edit.clear()
+            with _silent(self.notes_edit, self.tags_edit):
+                self.notes_edit.clear()
+                self.tags_edit.clear()
             self.notes_edit.setEnabled(False)
-            self.tags_edit.clear()
             self.tags_edit.setEnabled(False)
             return
 
@@ -187,72 +373,51 @@ class PreviewMetadataPane(QWidget):
             self.no_preview_widget.setText(f"{len(selected_paths)} items selected.\nPreview and detailed metadata are shown for single selections only.")
             self.preview_stack.setCurrentWidget(self.no_preview_widget)
             self._display_metadata_summary(selected_paths) 
-            self.notes_edit.clear()
+            with _silent(self.notes_edit, self.tags_edit):
+                self.notes_edit.clear()
+                self.tags_edit.clear()
             self.notes_edit.setPlaceholderText("Notes are available for single item selection.")
             self.notes_edit.setEnabled(False)
-            self.tags_edit.clear()
             self.tags_edit.setPlaceholderText("Tags are available for single item selection.")
             self.tags_edit.setEnabled(False)
         else: 
             self.no_preview_widget.setText("Select a file to preview.") 
-            self._display_single_item_metadata(path_to_preview)             
+            info = _file_info(path_to_preview) # Shared by the metadata fields and the preview dispatch
+            self._display_single_item_metadata(path_to_preview, info)
+            self.notes_edit.setPlaceholderText(self.NOTES_PLACEHOLDER)
             self.notes_edit.setEnabled(True)
+            self.tags_edit.setPlaceholderText(self.TAGS_PLACEHOLDER)
             self.tags_edit.setEnabled(True)
             self._load_notes_and_tags(path_to_preview)
 
-            file_info = QFileInfo(path_to_preview)
-            ext = file_info.suffix().lower()
-            
-            mime_db = QMimeDatabase()
-            mime_type = mime_db.mimeTypeForFile(path_to_preview) 
-            logger.debug(f"Previewing single file: '{path_to_preview}', Extension: '{ext}', MIME Type: '{mime_type.name()}'")
-
-            preview_loaded_successfully = False
-            
-            if ext in ['png', 'jpg', 'jpeg', 'gif', 'bmp', 'svg', 'webp', 'tiff', 'ico']:
-                self.image_preview_widget.load_image(path_to_preview)
-                self.preview_stack.setCurrentWidget(self.image_preview_widget)
-                preview_loaded_successfully = True
-            elif ext == 'pdf':
-                self.pdf_preview_widget.load_pdf(path_to_preview)
-                self.preview_stack.setCurrentWidget(self.pdf_preview_widget)
-                preview_loaded_successfully = True
-            elif ext in ['mp4', 'avi', 'mkv', 'mov', 'wmv', 'flv', 'webm', 'mpeg', 'mpg', 'ogv', '3gp']:
-                self.video_preview_widget.load_video(path_to_preview)
-                self.preview_stack.setCurrentWidget(self.video_preview_widget)
-                preview_loaded_successfully = True
-            elif ext in ['docx', 'doc']:
-                if ext == 'docx':
-                    self.docx_preview_widget.load_docx(path_to_preview)
-                    self.preview_stack.setCurrentWidget(self.docx_preview_widget)
-                else:
-                    self.doc_preview_widget.load_doc(path_to_preview)
-                    self.preview_stack.setCurrentWidget(self.doc_preview_widget)
-                preview_loaded_successfully = True
-            elif mime_type.name().startswith("text/") or \
-                 ext in ['py', 'js', 'json', 'md', 'log', 'ini', 'xml', 'html', 'css', 'csv', 'sh', 
-                          'bat', 'conf', 'yaml', 'yml', 'c', 'cpp', 'h', 'java', 'cs', 'rb', 'php', 'go', 'rs', 'swift', 'kt', 'kts', 'gradle']:
-                self.text_preview_widget.load_text(path_to_preview)
-                self.preview_stack.setCurrentWidget(self.text_preview_widget)
-                preview_loaded_successfully = True
-            elif not preview_loaded_successfully and mime_type.isValid():
-                if mime_type.name().startswith("image/"):
-                    self.image_preview_widget.load_image(path_to_preview)
-                    self.preview_stack.setCurrentWidget(self.image_preview_widget)
-                    preview_loaded_successfully = True
-                elif mime_type.name().startswith("video/"): 
-                    self.video_preview_widget.load_video(path_to_preview)
-                    self.preview_stack.setCurrentWidget(self.video_preview_widget)
-                    preview_loaded_successfully = True
-                
-            if not preview_loaded_successfully:
-                mime_name_display = mime_type.name() if mime_type.isValid() else "Unknown/Binary"
+            if info is None: # stat() failed; nothing on disk to preview
+                self.no_preview_widget.setText(f"No preview available for:\n'{os.path.basename(path_to_preview)}'\n(File not found)")
+                self.preview_stack.setCurrentWidget(self.no_preview_widget)
+                return
+
+            ext = info.suffix.lower()
+            mime_type = info.mime
+            mime_name = mime_type.name() if mime_type.isValid() else ""
+            logger.debug(f"Previewing single file: '{path_to_preview}', Extension: '{ext}', MIME Type: '{mime_name}'")
+
+            entry = _EXT_DISPATCH.get(ext)
+            if entry is None and mime_name:
+                entry = _MIME_TOP_DISPATCH.get(mime_name.partition('/')[0])
+
+            if entry is not None:
+                widget_attr, load_method = entry
+                widget = self._ensure_widget(widget_attr)
+                getattr(widget, load_method)(path_to_preview)
+                self.preview_stack.setCurrentWidget(widget)
+                self._active_preview_widget = widget
+            else:
+                mime_name_display = mime_name or "Unknown/Binary"
                 self.no_preview_widget.setText(f"No preview available for:\n'{os.path.basename(path_to_preview)}'\n(Type: {mime_name_display})")
                 self.preview_stack.setCurrentWidget(self.no_preview_widget)
-                
+
     def _clear_metadata_display_fields(self):
         self.lbl_name.setText("")
-        self.lbl_path.setText("")
+        self.lbl_path.clear()
         self.lbl_size.setText("")
         self.lbl_type.setText("")
         self.lbl_created.setText("")
@@ -262,16 +427,7 @@ class PreviewMetadataPane(QWidget):
         self._clear_metadata_display_fields()
         self.lbl_name.setText(f"{len(paths)} items selected")
         
-        total_size = 0
-        file_count = 0
-        folder_count = 0
-        for p in paths:
-            if os.path.exists(p):
-                if os.path.isfile(p):
-                    total_size += QFileInfo(p).size()
-                    file_count += 1
-                elif os.path.isdir(p):
-                    folder_count +=1
+        total_size, file_count, folder_count = _summarize_paths(paths)
         
         size_text = f"Total size (files): {self._format_size(total_size)}" if file_count > 0 else "No files selected"
         self.lbl_size.setText(size_text)
@@ -282,97 +438,136 @@ class PreviewMetadataPane(QWidget):
         if size_bytes < 0: return "N/A"
         if size_bytes < 1024:
             return f"{size_bytes} bytes"
-        size_kb = size_bytes / 1024
-        if size_kb < 1024:
-            return f"{size_kb:.2f} KB"
-        size_mb = size_kb / 1024
-        if size_mb < 1024:
-            return f"{size_mb:.2f} MB"
-        size_gb = size_mb / 1024
-        return f"{size_gb:.2f} GB"
-
-    def _display_single_item_metadata(self, path: str):
-        if not os.path.exists(path):
+        unit = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1) # Each unit is 2**10 of the previous
+        return f"{size_bytes / (1 << (unit * 10)):.2f} {_SIZE_UNITS[unit]}"
+
+    def _display_single_item_metadata(self, path: str, info: _FileInfo | None = None):
+        if info is None:
+            info = _file_info(path)
+        if info is None:
             self._clear_metadata_display_fields()
             self.lbl_name.setText(f"Path does not exist: {os.path.basename(path)}")
             logger.warning(f"Metadata display requested for non-existent path: {path}")
             return
             
-        file_info = QFileInfo(path)
-        self.lbl_name.setText(file_info.fileName())
-        self.lbl_path.setText(file_info.filePath()) 
-        self.lbl_size.setText(self._format_size(file_info.size()) if file_info.isFile() else "--- (Folder)")
+        self.lbl_name.setText(os.path.basename(path))
+        self.lbl_path.setPlainText(path)
+        self.lbl_size.setText(self._format_size(info.size) if info.is_file else "--- (Folder)")
         
-        mime_db = QMimeDatabase()
-        mime_type = mime_db.mimeTypeForFile(path)
+        mime_type = info.mime
+        suffix = info.suffix
         
         type_description = ""
-        if file_info.isDir():
+        if info.is_dir:
             type_description = "Folder"
         elif mime_type.isValid():
             type_description = mime_type.comment() if mime_type.comment() else mime_type.name()
             if not type_description or type_description == "application/octet-stream":
-                if file_info.suffix():
-                    type_description = f"{file_info.suffix().upper()} File"
+                if suffix:
+                    type_description = f"{suffix.upper()} File"
                 else:
                     type_description = "File"
         else: 
-            if file_info.suffix(): type_description = f"{file_info.suffix().upper()} File"
+            if suffix: type_description = f"{suffix.upper()} File"
             else: type_description = "File (Unknown Type)"
 
         self.lbl_type.setText(type_description)
         
-        birth_time = file_info.birthTime()
+        birth_time = info.birth_time
         self.lbl_created.setText(birth_time.toString("yyyy-MM-dd hh:mm:ss") if birth_time.isValid() else "N/A")
         
-        last_modified_time = file_info.lastModified()
+        last_modified_time = info.modified
         self.lbl_modified.setText(last_modified_time.toString("yyyy-MM-dd hh:mm:ss") if last_modified_time.isValid() else "N/A")
 
     def _load_notes_and_tags(self, file_path: str):
-        self.notes_edit.blockSignals(True)
-        self.tags_edit.blockSignals(True)
+        self._notes_dirty = False
+        self._last_saved_tags = None
+        with _silent(self.notes_edit, self.tags_edit):
+            self.notes_edit.clear()
+            self.tags_edit.clear()
+        self.tags_edit.setModified(False) # Set again by user edits; tells _on_metadata_loaded to keep them
 
         if self.metadata_service and file_path:
-            meta = self.metadata_service.get_metadata(file_path)
-            if meta:
-                self.notes_edit.setPlainText(meta.get('notes', ""))
-                self.tags_edit.setText(", ".join(meta.get('tags', [])))
-                logger.debug(f"Loaded metadata for '{file_path}': Tags={meta.get('tags', [])}, Notes present={'Yes' if meta.get('notes') else 'No'}")
-            else: 
-                self.notes_edit.clear()
-                self.tags_edit.clear()
-                logger.debug(f"No metadata found in DB for '{file_path}'. Cleared notes/tags fields.")
+            self._metadata_pool.start(_MetadataLoadTask(self.metadata_service, file_path, self._metadata_signals))
         else: 
-            self.notes_edit.clear()
-            self.tags_edit.clear()
             logger.debug("Metadata service not available or no file path. Cleared notes/tags fields.")
 
-        self.notes_edit.blockSignals(False)
-        self.tags_edit.blockSignals(False)
+    def _on_metadata_loaded(self, file_path: str, meta: dict | None):
+        if file_path != self.current_file_path:
+            return # Selection moved on while the lookup was in flight
+
+        self._last_saved_tags = tuple(meta.get('tags', [])) if meta else ()
+        if meta:
+            # Whatever the user typed while the lookup was in flight wins over the stored value;
+            # overwriting it here would let the next autosave write the old value back
+            with _silent(self.notes_edit, self.tags_edit):
+                if not self._notes_dirty:
+                    self.notes_edit.setPlainText(meta.get('notes', ""))
+                if not self.tags_edit.isModified():
+                    self.tags_edit.setText(", ".join(meta.get('tags', [])))
+            logger.debug(f"Loaded metadata for '{file_path}': Tags={meta.get('tags', [])}, Notes present={'Yes' if meta.get('notes') else 'No'}")
+        else: 
+            logger.debug(f"No metadata found in DB for '{file_path}'. Cleared notes/tags fields.")
+
+    def _on_notes_changed(self):
+        self._notes_dirty = True
+        # Restarting the timer on every keystroke is wasted work; 50 ms of slack on a 1.5 s delay is invisible
+        now = time.perf_counter()
+        if now - self._notes_last_restart > 0.05 or not self._notes_save_timer.isActive():
+            self._notes_last_restart = now
+            self._notes_save_timer.start()
+
+    def _queue_metadata_save(self, file_path: str, **fields):
+        with self._pending_writes_lock:
+            flush_queued = bool(self._pending_writes) # A queued task hasn't drained the buffer yet
+            self._pending_writes.setdefault(file_path, {}).update(fields)
+        if not flush_queued:
+            self._metadata_pool.start(_MetadataSaveTask(self.metadata_service, self._pending_writes,
+                                                        self._pending_writes_lock, self._metadata_signals))
 
     def _save_current_notes(self):
+        if not self._notes_dirty:
+            return
         if self.metadata_service and self.current_file_path and self.notes_edit.isEnabled():
+            self._notes_dirty = False
             note_text = self.notes_edit.toPlainText()
-            self.metadata_service.save_metadata(self.current_file_path, note_text=note_text)
-            self.metadata_updated_for_file.emit(self.current_file_path) 
-            logger.info(f"Notes saved for '{self.current_file_path}'.")
+            self._queue_metadata_save(self.current_file_path, note_text=note_text)
+            logger.info(f"Notes queued for save for '{self.current_file_path}'.")
 
     def _save_current_tags(self):
         if self.metadata_service and self.current_file_path and self.tags_edit.isEnabled():
             tags_str = self.tags_edit.text()
-            tags_list = [tag.strip() for tag in tags_str.split(',') if tag.strip()]
+            stripped = (t.strip() for t in tags_str.split(','))
+            tags = tuple(dict.fromkeys(t for t in stripped if t)) # Drops empties and repeats, keeps order
+            tags_list = list(tags)
+
+            with _silent(self.tags_edit):
+                self.tags_edit.setText(", ".join(tags_list)) 
+            if tags == self._last_saved_tags:
+                return # editingFinished also fires on plain focus loss; nothing changed
+            self._last_saved_tags = tags
             
-            self.metadata_service.save_metadata(self.current_file_path, tags=tags_list)
-            self.metadata_updated_for_file.emit(self.current_file_path) 
-            
-            self.tags_edit.blockSignals(True) 
-            self.tags_edit.setText(", ".join(tags_list)) 
-            self.tags_edit.blockSignals(False)
-            logger.info(f"Tags saved for '{self.current_file_path}': {tags_list}")
+            self._queue_metadata_save(self.current_file_path, tags=tags_list)
+            logger.info(f"Tags queued for save for '{self.current_file_path}': {tags_list}")
 
-    def closeEvent(self, a0: QCloseEvent | None):
+    def flush_pending_metadata(self):
+        """Writes out pending notes and blocks until queued metadata I/O is done. Call before closing the service."""
         if self._notes_save_timer.isActive():
-            logger.debug("Close event: Forcing save of pending notes.")
+            logger.debug("Forcing save of pending notes.")
             self._notes_save_timer.stop()
             self._save_current_notes()
-        super().closeEvent(a0)
\ No newline at end of file
+        self._metadata_pool.waitForDone()
+
+    def showEvent(self, a0: QShowEvent | None):
+        if not self._initial_sizes_set:
+            self._initial_sizes_set = True
+            total_width = self.width()
+            self.splitter.setSizes([int(total_width * 0.6), int(total_width * 0.4)])
+        if self._preview_stale:
+            self._preview_stale = False
+            self._preview_debounce.start()
+        super().showEvent(a0)
+
+    def closeEvent(self, a0: QCloseEvent | None):
+        self.flush_pending_metadata()
+        super().closeEvent(a0)